@@ -0,0 +1,20 @@
+"""
+gunicorn settings for the solver API:
+
+    gunicorn -c gunicorn_conf.py web_api_example:app
+
+One synchronous worker process per core serves requests in parallel, so each
+worker solves in its own request thread instead of keeping a process pool.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+workers = multiprocessing.cpu_count()
+worker_class = "sync"
+# Hard 4x4 searches can run well past gunicorn's 30 s default. Searches are
+# cancelled after SOLVE_TIMEOUT (100 s by default), before this kills the worker.
+timeout = 120
+# Import the app (and the solver modules, warmed up) once in the master;
+# workers fork from it and share those pages copy-on-write.
+preload_app = True
+raw_env = ["SOLVER_PROCESSES=0"]
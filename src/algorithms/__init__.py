@@ -2,6 +2,8 @@ from .heuristics import (
     misplaced_tiles_heuristic,
     manhattan_distance_heuristic,
     linear_conflict_heuristic,
+    pattern_database_heuristic,
+    clear_heuristic_cache,
 )
 from .search_algorithms import (
     SearchAlgorithm,
@@ -10,18 +12,25 @@ from .search_algorithms import (
     HillClimbingSearch,
     SimulatedAnnealingSearch,
     IDAStarSearch,
+    IDAStarSearchParallel,
     GeneticAlgorithmSearch,
 )
+from .registry import ALGORITHM_FACTORIES, build_algorithm
 
 __all__ = [
     "misplaced_tiles_heuristic",
     "manhattan_distance_heuristic",
     "linear_conflict_heuristic",
+    "pattern_database_heuristic",
+    "clear_heuristic_cache",
     "SearchAlgorithm",
     "AStarSearch",
     "GreedyBestFirstSearch",
     "HillClimbingSearch",
     "SimulatedAnnealingSearch",
     "IDAStarSearch",
+    "IDAStarSearchParallel",
     "GeneticAlgorithmSearch",
+    "ALGORITHM_FACTORIES",
+    "build_algorithm",
 ]
@@ -1,7 +1,82 @@
 from __future__ import annotations
+import math
+import os
+from functools import lru_cache
 from typing import Callable, Tuple
 
+from src.algorithms import heuristics_numba
+
 Heuristic = Callable[[Tuple[int, ...]], float]
+HeuristicDelta = Callable[[Tuple[int, ...], Tuple[int, ...], float], float]
+
+# Upper bound on memoized h(state) values per heuristic; 0 disables caching.
+H_CACHE_SIZE = int(os.environ.get("PUZZLE_H_CACHE_SIZE", 1 << 20))
+
+# Largest reachable state space a pattern database table may cover (3x3: 181,440).
+PDB_MAX_STATES = 1 << 20
+
+
+def _memoize(h: Heuristic) -> Heuristic:
+    """Cache h(state) results; states are hashable tuples and revisited often."""
+    if H_CACHE_SIZE <= 0:
+        return h
+    return lru_cache(maxsize=H_CACHE_SIZE)(h)
+
+
+def _goal_detecting(h: Heuristic) -> Heuristic:
+    """
+    Mark h as zero exactly on the goal state it was built for, letting search
+    algorithms use h == 0 as their goal test.
+    """
+    h.detects_goal = True
+    return h
+
+
+def heuristic_detects_goal(h: Heuristic) -> bool:
+    """True if h(state) == 0 holds exactly when state is the goal."""
+    return getattr(h, "detects_goal", False)
+
+
+def heuristic_delta(h: Heuristic) -> HeuristicDelta | None:
+    """
+    Return h's incremental update delta(parent_state, child_state, parent_h),
+    or None if h must be evaluated from scratch for every state.
+    """
+    return getattr(h, "delta", None)
+
+
+def clear_heuristic_cache(h: Heuristic) -> None:
+    """Drop memoized values held by a heuristic built by one of the factories."""
+    cache_clear = getattr(h, "cache_clear", None)
+    if cache_clear is not None:
+        cache_clear()
+
+
+def _count_inversions(values: list[int]) -> int:
+    """Number of pairs i < j with values[i] > values[j]; unrolled for lines of <= 4 tiles."""
+    k = len(values)
+    if k == 2:
+        a, b = values
+        return int(a > b)
+    if k == 3:
+        a, b, c = values
+        return (a > b) + (a > c) + (b > c)
+    if k == 4:
+        a, b, c, d = values
+        return (a > b) + (a > c) + (a > d) + (b > c) + (b > d) + (c > d)
+    if k < 2:
+        return 0
+    mid = k // 2
+    left = sorted(values[:mid])
+    right = sorted(values[mid:])
+    count = _count_inversions(values[:mid]) + _count_inversions(values[mid:])
+    # Cross inversions: for each right element, left elements greater than it.
+    i = 0
+    for value in right:
+        while i < mid and left[i] <= value:
+            i += 1
+        count += mid - i
+    return count
 
 
 def misplaced_tiles_heuristic(goal_state: Tuple[int, ...]) -> Heuristic:
@@ -12,75 +87,171 @@ def misplaced_tiles_heuristic(goal_state: Tuple[int, ...]) -> Heuristic:
                 misplaced += 1
         return float(misplaced)
 
-    return h
+    return _goal_detecting(_memoize(h))
 
 
-def manhattan_distance_heuristic(goal_state: Tuple[int, ...], size: int) -> Heuristic:
-    tile_to_pos: dict[int, tuple[int, int]] = {}
+@lru_cache(maxsize=8)
+def _goal_positions(goal_state: Tuple[int, ...], size: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return (goal_row, goal_col) tuples indexed by tile value."""
+    goal_row = [0] * len(goal_state)
+    goal_col = [0] * len(goal_state)
     for idx, tile in enumerate(goal_state):
+        goal_row[tile], goal_col[tile] = divmod(idx, size)
+    return tuple(goal_row), tuple(goal_col)
+
+
+@lru_cache(maxsize=8)
+def _distance_table(goal_state: Tuple[int, ...], size: int) -> tuple[tuple[int, ...], ...]:
+    """
+    distance[idx][tile]: Manhattan distance of `tile` sitting at `idx`; the
+    blank contributes 0. Turns Manhattan distance into one lookup per tile.
+    Cached per goal like _goal_positions, since every solve builds a fresh
+    heuristic for the same few goals.
+    """
+    goal_row, goal_col = _goal_positions(goal_state, size)
+    distance: list[tuple[int, ...]] = []
+    for idx in range(size * size):
         row, col = divmod(idx, size)
-        tile_to_pos[tile] = (row, col)
+        distance.append(
+            tuple(
+                0 if tile == 0 else abs(row - goal_row[tile]) + abs(col - goal_col[tile])
+                for tile in range(size * size)
+            )
+        )
+    return tuple(distance)
 
-    def h(state: Tuple[int, ...]) -> float:
+
+def manhattan_distance_heuristic(goal_state: Tuple[int, ...], size: int) -> Heuristic:
+    distance_rows = _distance_table(tuple(goal_state), size)
+
+    if heuristics_numba.NUMBA_AVAILABLE:
+        h = _numba_heuristic(heuristics_numba.manhattan_kernel, goal_state, size)
+    else:
+        def h(state: Tuple[int, ...]) -> float:
+            return float(sum([row[tile] for row, tile in zip(distance_rows, state)]))
+
+        h = _goal_detecting(_memoize(h))
+
+    def delta(parent_state: Tuple[int, ...], child_state: Tuple[int, ...], parent_h: float) -> float:
+        # A move slides one tile from the child's blank cell into the parent's,
+        # so only that tile's distance changes.
+        old_idx = child_state.index(0)
+        new_idx = parent_state.index(0)
+        tile = parent_state[old_idx]
+        return parent_h + distance_rows[new_idx][tile] - distance_rows[old_idx][tile]
+
+    h.delta = delta
+    return h
+
+
+def linear_conflict_heuristic(goal_state: Tuple[int, ...], size: int) -> Heuristic:
+    if heuristics_numba.NUMBA_AVAILABLE:
+        return _numba_heuristic(heuristics_numba.linear_conflict_kernel, goal_state, size)
+
+    goal_row, goal_col = _goal_positions(tuple(goal_state), size)
+    distance = _distance_table(tuple(goal_state), size)
+
+    def row_cost(r: int, line: Tuple[int, ...]) -> int:
+        """Manhattan distance of the tiles in row r plus 2 * conflicts among them."""
         total = 0
-        for idx, tile in enumerate(state):
+        in_goal_row: list[int] = []
+        for c, tile in enumerate(line):
             if tile == 0:
                 continue
-            row, col = divmod(idx, size)
-            goal_row, goal_col = tile_to_pos[tile]
-            total += abs(row - goal_row) + abs(col - goal_col)
+            total += distance[r * size + c][tile]
+            if goal_row[tile] == r:
+                in_goal_row.append(goal_col[tile])
+        return total + 2 * _count_inversions(in_goal_row)
+
+    def col_cost(c: int, line: Tuple[int, ...]) -> int:
+        """2 * conflicts among the tiles of column c that belong to it."""
+        in_goal_col = [goal_row[tile] for tile in line if tile != 0 and goal_col[tile] == c]
+        return 2 * _count_inversions(in_goal_col)
+
+    # Per-line pattern tables: the cost of a row/column depends only on the
+    # tiles in it, and search revisits the same lines constantly. Filled on
+    # first sight and bounded by the number of size-tile patterns.
+    rows = tuple((r * size, (r + 1) * size, r, {}) for r in range(size))
+    cols = tuple((c, {}) for c in range(size))
+
+    def h(state: Tuple[int, ...]) -> float:
+        total = 0
+        for start, stop, r, table in rows:
+            line = state[start:stop]
+            cost = table.get(line)
+            if cost is None:
+                cost = table[line] = row_cost(r, line)
+            total += cost
+        for c, table in cols:
+            line = state[c::size]
+            cost = table.get(line)
+            if cost is None:
+                cost = table[line] = col_cost(c, line)
+            total += cost
         return float(total)
 
-    return h
+    return _goal_detecting(_memoize(h))
 
 
-def linear_conflict_heuristic(goal_state: Tuple[int, ...], size: int) -> Heuristic:
-    manhattan = manhattan_distance_heuristic(goal_state, size)
-    
-    tile_to_pos: dict[int, tuple[int, int]] = {}
-    for idx, tile in enumerate(goal_state):
+@lru_cache(maxsize=4)
+def _goal_distances(goal_state: Tuple[int, ...], size: int) -> dict[Tuple[int, ...], int]:
+    """Breadth-first search back from the goal: exact moves-to-goal of every reachable state."""
+    moves = []
+    for idx in range(size * size):
         row, col = divmod(idx, size)
-        tile_to_pos[tile] = (row, col)
+        moves.append(tuple(
+            r * size + c
+            for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+            if 0 <= r < size and 0 <= c < size
+        ))
+
+    distances = {goal_state: 0}
+    frontier = [goal_state]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for state in frontier:
+            blank = state.index(0)
+            for swap in moves[blank]:
+                state_list = list(state)
+                state_list[blank], state_list[swap] = state_list[swap], 0
+                child = tuple(state_list)
+                if child not in distances:
+                    distances[child] = depth
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+def pattern_database_heuristic(goal_state: Tuple[int, ...], size: int) -> Heuristic:
+    """
+    Pattern database over the whole board: h(state) is a table lookup of the
+    exact solution length, so A* expands only states on an optimal path.
+
+    The table holds every reachable state, which limits it to boards of at
+    most PDB_MAX_STATES states (3x3); larger sizes raise ValueError. Built
+    once per goal and shared; unreachable states get +inf.
+    """
+    if math.factorial(size * size) // 2 > PDB_MAX_STATES:
+        raise ValueError(f"Pattern database is not available for {size}x{size} boards")
+    distances = _goal_distances(tuple(goal_state), size)
+    inf = float("inf")
 
     def h(state: Tuple[int, ...]) -> float:
-        h_val = manhattan(state)
-        
-        conflicts = 0
-        
-        for r in range(size):
-            row_tiles = []
-            for c in range(size):
-                tile = state[r * size + c]
-                if tile != 0:
-                    t_r, t_c = tile_to_pos[tile]
-                    if t_r == r:
-                        row_tiles.append((tile, c, t_c))
-            
-            for i in range(len(row_tiles)):
-                for j in range(i + 1, len(row_tiles)):
-                    t1_val, t1_cur, t1_goal = row_tiles[i]
-                    t2_val, t2_cur, t2_goal = row_tiles[j]
-                    
-                    if t1_goal > t2_goal:
-                        conflicts += 1
-
-        for c in range(size):
-            col_tiles = []
-            for r in range(size):
-                tile = state[r * size + c]
-                if tile != 0:
-                    t_r, t_c = tile_to_pos[tile]
-                    if t_c == c:
-                        col_tiles.append((tile, r, t_r))
-            
-            for i in range(len(col_tiles)):
-                for j in range(i + 1, len(col_tiles)):
-                    t1_val, t1_cur, t1_goal = col_tiles[i]
-                    t2_val, t2_cur, t2_goal = col_tiles[j]
-                    
-                    if t1_goal > t2_goal:
-                        conflicts += 1
-
-        return h_val + 2 * conflicts
+        return float(distances.get(state, inf))
 
-    return h
+    return _goal_detecting(h)
+
+
+def _numba_heuristic(kernel, goal_state: Tuple[int, ...], size: int) -> Heuristic:
+    """Wrap a compiled kernel from heuristics_numba as a memoized Heuristic."""
+    goal_row, goal_col = heuristics_numba.goal_position_arrays(tuple(goal_state), size)
+    # The first call compiles (or loads from Numba's cache) the kernel for this
+    # tuple length; pay it here rather than inside the first timed search.
+    kernel(tuple(goal_state), goal_row, goal_col, size)
+
+    def h(state: Tuple[int, ...]) -> float:
+        return float(kernel(state, goal_row, goal_col, size))
+
+    return _goal_detecting(_memoize(h))
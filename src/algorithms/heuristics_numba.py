@@ -0,0 +1,73 @@
+"""
+Numba-compiled heuristic kernels.
+
+Numba is optional: when it (or NumPy) is missing, NUMBA_AVAILABLE is False
+and the pure Python heuristics in heuristics.py are used unchanged.
+
+Kernels take the state tuple as is; Numba unboxes a homogeneous tuple
+directly, which is cheaper per call than building an array from it.
+
+Each kernel is compiled (or loaded from the on-disk cache) on its first
+call for a given board size; heuristics.py makes that call when it builds
+the heuristic so the cost stays out of timed searches.
+"""
+from __future__ import annotations
+from functools import lru_cache
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def manhattan_kernel(state, goal_row, goal_col, size):
+        """Sum of Manhattan distances of every non-blank tile to its goal cell."""
+        total = 0
+        for idx in range(len(state)):
+            tile = state[idx]
+            if tile != 0:
+                total += abs(idx // size - goal_row[tile]) + abs(idx % size - goal_col[tile])
+        return total
+
+    @njit(cache=True)
+    def linear_conflict_kernel(state, goal_row, goal_col, size):
+        """Manhattan distance plus 2 * linear conflicts in a single scan of state."""
+        total = 0
+        conflicts = 0
+        for r in range(size):
+            for c in range(size):
+                tile = state[r * size + c]
+                if tile == 0:
+                    continue
+                gr = goal_row[tile]
+                gc = goal_col[tile]
+                total += abs(r - gr) + abs(c - gc)
+                if gr == r:
+                    for c2 in range(c):
+                        other = state[r * size + c2]
+                        if other != 0 and goal_row[other] == r and goal_col[other] > gc:
+                            conflicts += 1
+                if gc == c:
+                    for r2 in range(r):
+                        other = state[r2 * size + c]
+                        if other != 0 and goal_col[other] == c and goal_row[other] > gr:
+                            conflicts += 1
+        return total + 2 * conflicts
+
+    @lru_cache(maxsize=8)
+    def goal_position_arrays(goal_state, size):
+        """
+        Return (goal_row, goal_col) int64 arrays indexed by tile value; cached
+        per goal and shared, so callers must not modify them.
+        """
+        goal_row = np.zeros(len(goal_state), dtype=np.int64)
+        goal_col = np.zeros(len(goal_state), dtype=np.int64)
+        for idx, tile in enumerate(goal_state):
+            goal_row[tile], goal_col[tile] = divmod(idx, size)
+        return goal_row, goal_col
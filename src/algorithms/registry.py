@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Dict
+
+from src.algorithms.heuristics import (
+    misplaced_tiles_heuristic,
+    manhattan_distance_heuristic,
+    linear_conflict_heuristic,
+)
+from src.algorithms.search_algorithms import (
+    SearchAlgorithm,
+    AStarSearch,
+    GreedyBestFirstSearch,
+    HillClimbingSearch,
+    SimulatedAnnealingSearch,
+    IDAStarSearch,
+    GeneticAlgorithmSearch,
+)
+
+from src.core import BucketQueue
+
+if TYPE_CHECKING:
+    from src.domain import SlidingPuzzleProblem
+
+
+def _manhattan(problem: "SlidingPuzzleProblem"):
+    return manhattan_distance_heuristic(problem.goal_state, problem.size)
+
+
+def _linear(problem: "SlidingPuzzleProblem"):
+    return linear_conflict_heuristic(problem.goal_state, problem.size)
+
+
+# Algorithm name -> factory. Each factory builds only the heuristic it uses.
+ALGORITHM_FACTORIES: Dict[str, Callable[["SlidingPuzzleProblem"], SearchAlgorithm]] = {
+    # Unit step costs and integer heuristics give integer f-values, so unweighted
+    # A* can use a bucket queue; the 1.5 weight needs the binary heap.
+    "astar_misplaced": lambda p: AStarSearch(
+        heuristic=misplaced_tiles_heuristic(p.goal_state), queue_factory=BucketQueue
+    ),
+    "astar_manhattan": lambda p: AStarSearch(heuristic=_manhattan(p), queue_factory=BucketQueue),
+    "astar_weighted": lambda p: AStarSearch(heuristic=_manhattan(p), weight=1.5),
+    "astar_linear": lambda p: AStarSearch(heuristic=_linear(p), queue_factory=BucketQueue),
+    "greedy_manhattan": lambda p: GreedyBestFirstSearch(heuristic=_manhattan(p)),
+    "hill_climbing_manhattan": lambda p: HillClimbingSearch(heuristic=_manhattan(p), max_steps=2000),
+    "sa_manhattan": lambda p: SimulatedAnnealingSearch(
+        heuristic=_manhattan(p),
+        T0=10.0,
+        alpha=0.99,
+        max_steps=5000,
+    ),
+    "idastar_manhattan": lambda p: IDAStarSearch(heuristic=_manhattan(p)),
+    "idastar_linear": lambda p: IDAStarSearch(heuristic=_linear(p)),
+    "genetic_manhattan": lambda p: GeneticAlgorithmSearch(
+        heuristic=_manhattan(p),
+        population_size=50,
+        mutation_rate=0.1,
+        max_generations=100,
+        chromosome_length=30,
+    ),
+}
+
+
+def build_algorithm(name: str, problem: "SlidingPuzzleProblem") -> SearchAlgorithm:
+    factory = ALGORITHM_FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown algorithm: {name}")
+    return factory(problem)
@@ -1,46 +1,104 @@
 from __future__ import annotations
 import heapq
 import math
+import multiprocessing
+import os
 import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, List, Tuple
-from src.core import Problem, Node, SearchResult
-from src.algorithms.heuristics import Heuristic
+from typing import Any, Callable, Hashable, List, Sequence, Tuple
+from src.core import Problem, Node, SearchResult, SearchCancelled, PriorityQueue, HeapQueue
+from src.algorithms.heuristics import Heuristic, heuristic_delta, heuristic_detects_goal
+
+
+def _node_h(heuristic: Heuristic, node: Node) -> float:
+    """Return h(node.state), evaluating the heuristic at most once per node."""
+    h = node.h_value
+    if h is None:
+        h = node.h_value = heuristic(node.state)
+    return h
+
+
+def _goal_test(problem: Problem, heuristic: Heuristic) -> Callable[[Node], bool]:
+    """
+    Goal test for nodes popped from a heuristic-ordered frontier. When the
+    heuristic is zero exactly at the goal, reuse the cached h instead of
+    comparing the state against the goal.
+    """
+    if heuristic_detects_goal(heuristic):
+        return lambda n: _node_h(heuristic, n) == 0
+    return lambda n: problem.is_goal(n.state)
+
+
+# Expansions between progress_cb calls / cancel_event checks.
+PROGRESS_INTERVAL = 10_000
 
 
 class SearchAlgorithm(ABC):
+    # Optional hooks, normally set by SearchAgent.solve.
+    cancel_event: threading.Event | None = None
+    progress_cb: Callable[[int], None] | None = None
+
+    def _report(self, nodes_expanded: int) -> None:
+        """Pass progress to progress_cb; raise SearchCancelled if cancel_event is set."""
+        if self.progress_cb is not None:
+            self.progress_cb(nodes_expanded)
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise SearchCancelled(nodes_expanded)
+
     @abstractmethod
     def search(self, problem: Problem) -> SearchResult:
         raise NotImplementedError
 
 
 class AStarSearch(SearchAlgorithm):
-    def __init__(self, heuristic: Heuristic, weight: float = 1.0) -> None:
+    def __init__(
+        self,
+        heuristic: Heuristic,
+        weight: float = 1.0,
+        queue_factory: Callable[[], PriorityQueue] = HeapQueue,
+    ) -> None:
+        """
+        queue_factory builds the open list. The default binary heap handles any
+        f-values; BucketQueue is faster but needs integer f = g + w * h, i.e.
+        integer step costs, an integer-valued heuristic and an integer weight.
+        """
         self.heuristic = heuristic
         self.weight = weight
+        self.queue_factory = queue_factory
 
     def search(self, problem: Problem) -> SearchResult:
         start_time = time.perf_counter()
         start_state = problem.initial_state()
         start_node = Node(start_state)
 
-        frontier: List[Tuple[float, int, Node]] = []
-        counter = 0
+        # Entries carry the state key so it is computed once per generated node.
+        frontier = self.queue_factory()
+        push, pop = frontier.push, frontier.pop
 
         def f(n: Node) -> float:
             # f(n) = g(n) + w * h(n)
-            return n.path_cost + self.weight * self.heuristic(n.state)
+            return n.path_cost + self.weight * _node_h(self.heuristic, n)
 
-        heapq.heappush(frontier, (f(start_node), counter, start_node))
+        is_goal = _goal_test(problem, self.heuristic)
+        delta = heuristic_delta(self.heuristic)
+        start_key = problem.state_key(start_state)
+        push(f(start_node), (start_node, start_key))
 
-        best_g: dict[Any, float] = {}
+        # Cheapest g seen for every generated state. A child is only pushed when it
+        # improves on this, so each state has at most one live frontier entry and
+        # entries superseded by a cheaper path are skipped when popped.
+        best_g: dict[Hashable, float] = {start_key: 0.0}
         nodes_expanded = 0
 
         while frontier:
-            _, _, node = heapq.heappop(frontier)
+            node, state_key = pop()
+
+            if node.path_cost > best_g[state_key]:
+                continue
 
-            if problem.is_goal(node.state):
+            if is_goal(node):
                 end_time = time.perf_counter()
                 return SearchResult(
                     solution_node=node,
@@ -49,18 +107,19 @@ class AStarSearch(SearchAlgorithm):
                     runtime=end_time - start_time,
                 )
 
-            state_key = problem.state_key(node.state)
-            if state_key in best_g and best_g[state_key] <= node.path_cost:
-                continue
-
-            best_g[state_key] = node.path_cost
             nodes_expanded += 1
+            if nodes_expanded % PROGRESS_INTERVAL == 0:
+                self._report(nodes_expanded)
 
             for child in node.expand(problem):
                 sk = problem.state_key(child.state)
-                if sk not in best_g or child.path_cost < best_g[sk]:
-                    counter += 1
-                    heapq.heappush(frontier, (f(child), counter, child))
+                g = best_g.get(sk)
+                if g is None or child.path_cost < g:
+                    best_g[sk] = child.path_cost
+                    if delta is not None:
+                        # node.h_value is set: node was scored when pushed.
+                        child.h_value = delta(node.state, child.state, node.h_value)
+                    push(f(child), (child, sk))
 
         end_time = time.perf_counter()
         return SearchResult(
@@ -80,25 +139,26 @@ class GreedyBestFirstSearch(SearchAlgorithm):
         start_state = problem.initial_state()
         start_node = Node(start_state)
 
-        frontier: List[Tuple[float, int, Node]] = []
+        # Entries carry the state key so it is computed once per generated node.
+        frontier: List[Tuple[float, int, Node, Hashable]] = []
         counter = 0
 
         def f(n: Node) -> float:
-            return self.heuristic(n.state)
+            return _node_h(self.heuristic, n)
 
-        heapq.heappush(frontier, (f(start_node), counter, start_node))
-        visited: set[Any] = set()
+        is_goal = _goal_test(problem, self.heuristic)
+        heapq.heappush(frontier, (f(start_node), counter, start_node, problem.state_key(start_state)))
+        visited: set[Hashable] = set()
         nodes_expanded = 0
 
         while frontier:
-            _, _, node = heapq.heappop(frontier)
-            state_key = problem.state_key(node.state)
+            _, _, node, state_key = heapq.heappop(frontier)
 
             if state_key in visited:
                 continue
             visited.add(state_key)
 
-            if problem.is_goal(node.state):
+            if is_goal(node):
                 end_time = time.perf_counter()
                 return SearchResult(
                     solution_node=node,
@@ -108,12 +168,14 @@ class GreedyBestFirstSearch(SearchAlgorithm):
                 )
 
             nodes_expanded += 1
+            if nodes_expanded % PROGRESS_INTERVAL == 0:
+                self._report(nodes_expanded)
 
             for child in node.expand(problem):
                 ck = problem.state_key(child.state)
                 if ck not in visited:
                     counter += 1
-                    heapq.heappush(frontier, (f(child), counter, child))
+                    heapq.heappush(frontier, (f(child), counter, child, ck))
 
         end_time = time.perf_counter()
         return SearchResult(
@@ -133,7 +195,7 @@ class HillClimbingSearch(SearchAlgorithm):
         start_time = time.perf_counter()
         current_state = problem.initial_state()
         current_node = Node(current_state)
-        current_h = self.heuristic(current_state)
+        current_h = _node_h(self.heuristic, current_node)
 
         nodes_expanded = 0
         iterations = 0
@@ -150,26 +212,14 @@ class HillClimbingSearch(SearchAlgorithm):
                     iterations=iterations,
                 )
 
-            neighbors: list[Node] = []
-            for action in problem.actions(current_state):
-                next_state = problem.result(current_state, action)
-                nodes_expanded += 1
-                neighbors.append(
-                    Node(
-                        state=next_state,
-                        parent=current_node,
-                        action=action,
-                        path_cost=current_node.path_cost
-                        + problem.step_cost(current_state, action, next_state),
-                        depth=current_node.depth + 1,
-                    )
-                )
+            neighbors = current_node.expand(problem)
+            nodes_expanded += len(neighbors)
 
             if not neighbors:
                 break
 
-            best_neighbor = min(neighbors, key=lambda n: self.heuristic(n.state))
-            best_h = self.heuristic(best_neighbor.state)
+            scored = [(_node_h(self.heuristic, n), n) for n in neighbors]
+            best_h, best_neighbor = min(scored, key=lambda x: x[0])
 
             if best_h >= current_h:
                 break
@@ -189,6 +239,69 @@ class HillClimbingSearch(SearchAlgorithm):
         )
 
 
+# (algorithm, problem) shared with forked multi-start workers.
+_multi_start_job: tuple[Any, Problem] | None = None
+
+
+def _multi_start_worker(seed: int) -> tuple[bool, int, int, list[tuple[Any, Any, float, int]]]:
+    algorithm, problem = _multi_start_job
+    algorithm.cancel_event = algorithm.progress_cb = None
+    random.seed(seed)
+    result = algorithm._single_run(problem)
+    # Ship the path as flat tuples; pickling a long Node chain recurses per node.
+    path = [(n.state, n.action, n.path_cost, n.depth) for n in result.solution_path]
+    return result.success, result.nodes_expanded, result.iterations, path
+
+
+def _multi_start_search(
+    algorithm: Any, problem: Problem, runs: int, seeds: Sequence[int] | None
+) -> SearchResult:
+    """
+    Run algorithm._single_run(problem) `runs` times in forked processes, each
+    with its own random seed, and keep the cheapest successful run.
+
+    nodes_expanded and iterations are summed over all runs; runtime is wall
+    clock for the whole batch.
+    """
+    global _multi_start_job
+    start_time = time.perf_counter()
+    if seeds is None:
+        # Forked workers inherit the parent's random state, so each needs a seed.
+        seeds = [random.randrange(2**32) for _ in range(runs)]
+    elif len(seeds) != runs:
+        raise ValueError(f"Expected {runs} seeds, got {len(seeds)}")
+
+    _multi_start_job = (algorithm, problem)
+    pool = multiprocessing.get_context("fork").Pool(min(runs, os.cpu_count() or 1))
+    try:
+        outcomes = pool.map(_multi_start_worker, seeds)
+    finally:
+        pool.terminate()
+        _multi_start_job = None
+
+    nodes_expanded = 0
+    iterations = 0
+    best_path: list[tuple[Any, Any, float, int]] | None = None
+    for success, expanded, run_iterations, path in outcomes:
+        nodes_expanded += expanded
+        iterations += run_iterations
+        if success and (best_path is None or path[-1][2] < best_path[-1][2]):
+            best_path = path
+
+    node: Node | None = None
+    for state, action, path_cost, depth in best_path or ():
+        node = Node(state=state, parent=node, action=action, path_cost=path_cost, depth=depth)
+
+    end_time = time.perf_counter()
+    return SearchResult(
+        solution_node=node,
+        success=node is not None,
+        nodes_expanded=nodes_expanded,
+        runtime=end_time - start_time,
+        iterations=iterations,
+    )
+
+
 class SimulatedAnnealingSearch(SearchAlgorithm):
     def __init__(
         self,
@@ -196,13 +309,27 @@ class SimulatedAnnealingSearch(SearchAlgorithm):
         T0: float = 10.0,
         alpha: float = 0.99,
         max_steps: int = 5000,
+        parallel_runs: int = 1,
+        seeds: Sequence[int] | None = None,
     ) -> None:
+        """
+        With parallel_runs > 1, independent annealers run in forked processes
+        (one seed each; drawn at random when seeds is None) and the cheapest
+        solution wins. Falls back to a single run without the fork start method.
+        """
         self.heuristic = heuristic
         self.T0 = T0
         self.alpha = alpha
         self.max_steps = max_steps
+        self.parallel_runs = parallel_runs
+        self.seeds = seeds
 
     def search(self, problem: Problem) -> SearchResult:
+        if self.parallel_runs > 1 and "fork" in multiprocessing.get_all_start_methods():
+            return _multi_start_search(self, problem, self.parallel_runs, self.seeds)
+        return self._single_run(problem)
+
+    def _single_run(self, problem: Problem) -> SearchResult:
         start_time = time.perf_counter()
         current_state = problem.initial_state()
         current_node = Node(current_state)
@@ -235,6 +362,8 @@ class SimulatedAnnealingSearch(SearchAlgorithm):
             action = random.choice(actions)
             next_state = problem.result(current_state, action)
             nodes_expanded += 1
+            if nodes_expanded % PROGRESS_INTERVAL == 0:
+                self._report(nodes_expanded)
 
             next_h = self.heuristic(next_state)
             delta = next_h - current_h
@@ -277,46 +406,71 @@ class SimulatedAnnealingSearch(SearchAlgorithm):
         )
 
 
+# IDA* search frame: (state, parent_frame, action, path_cost, depth).
+_Frame = Tuple[Any, Any, Any, float, int]
+
+
 class IDAStarSearch(SearchAlgorithm):
     def __init__(self, heuristic: Heuristic) -> None:
         self.heuristic = heuristic
 
-    def search(self, problem: Problem) -> SearchResult:
-        start_time = time.perf_counter()
-        root = Node(problem.initial_state())
-        bound = self.heuristic(root.state)
+    @staticmethod
+    def _frame_to_node(frame: _Frame) -> Node:
+        """Rebuild the Node chain for a solution frame so SearchResult is unchanged."""
+        frames: List[_Frame] = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame[1]
+        node: Node | None = None
+        for state, _, action, path_cost, depth in reversed(frames):
+            node = Node(state=state, parent=node, action=action, path_cost=path_cost, depth=depth)
+        return node
+
+    def _bounded_search(
+        self, problem: Problem, root: _Frame, bound: float, expanded_before: int = 0
+    ) -> tuple[float, _Frame | None, int]:
+        """
+        One depth-first pass limited to f <= bound.
+
+        Returns (t, solution, nodes_expanded) where t is -1.0 if a goal was
+        found, otherwise the smallest f that exceeded the bound (+inf if none).
+        expanded_before offsets the counts passed to progress_cb.
+        """
         nodes_expanded = 0
+        heuristic = self.heuristic
+        delta = heuristic_delta(heuristic)
 
-        def search_recursive(node: Node, g: float, bound: float) -> tuple[float, Node | None]:
+        # The recursion passes plain tuples instead of Node objects; a Node chain
+        # is only built for the solution path.
+        def search_recursive(frame: _Frame, h: float, bound: float) -> tuple[float, _Frame | None]:
             nonlocal nodes_expanded
-            f = g + self.heuristic(node.state)
+            state, parent, _, g, depth = frame
+            f = g + h
             
             if f > bound:
                 return f, None
             
-            if problem.is_goal(node.state):
-                return -1.0, node
+            if problem.is_goal(state):
+                return -1.0, frame
             
             min_val = float('inf')
             nodes_expanded += 1
+            if nodes_expanded % PROGRESS_INTERVAL == 0:
+                self._report(expanded_before + nodes_expanded)
             
-            for action in problem.actions(node.state):
-                next_state = problem.result(node.state, action)
-                
-                if node.parent and node.parent.state == next_state:
+            # Moving straight back to the parent never helps; skip it before
+            # recursing.
+            parent_state = parent[0] if parent is not None else None
+            
+            for action, next_state, step_cost in problem.successors(state):
+                if next_state == parent_state:
                     continue
                 
-                step_cost = problem.step_cost(node.state, action, next_state)
-                child = Node(
-                    state=next_state,
-                    parent=node,
-                    action=action,
-                    path_cost=g + step_cost,
-                    depth=node.depth + 1
+                next_h = delta(state, next_state, h) if delta is not None else heuristic(next_state)
+                t, solution = search_recursive(
+                    (next_state, frame, action, g + step_cost, depth + 1), next_h, bound
                 )
                 
-                t, solution = search_recursive(child, g + step_cost, bound)
-                
                 if t == -1.0:
                     return -1.0, solution
                 
@@ -325,13 +479,23 @@ class IDAStarSearch(SearchAlgorithm):
             
             return min_val, None
 
+        t, solution = search_recursive(root, heuristic(root[0]), bound)
+        return t, solution, nodes_expanded
+
+    def search(self, problem: Problem) -> SearchResult:
+        start_time = time.perf_counter()
+        root: _Frame = (problem.initial_state(), None, None, 0.0, 0)
+        bound = self.heuristic(root[0])
+        nodes_expanded = 0
+
         while True:
-            t, solution = search_recursive(root, 0.0, bound)
+            t, solution, expanded = self._bounded_search(problem, root, bound, nodes_expanded)
+            nodes_expanded += expanded
             
             if t == -1.0:
                 end_time = time.perf_counter()
                 return SearchResult(
-                    solution_node=solution,
+                    solution_node=self._frame_to_node(solution),
                     success=True,
                     nodes_expanded=nodes_expanded,
                     runtime=end_time - start_time
@@ -349,6 +513,90 @@ class IDAStarSearch(SearchAlgorithm):
             bound = t
 
 
+# (algorithm, problem, root) shared with forked parallel-window IDA* workers.
+_parallel_ida_job: tuple[IDAStarSearch, Problem, _Frame] | None = None
+
+
+def _parallel_ida_worker(bound: float) -> tuple[float, _Frame | None, int]:
+    algorithm, problem, root = _parallel_ida_job
+    # Progress and cancellation hooks belong to the parent process.
+    algorithm.cancel_event = algorithm.progress_cb = None
+    return algorithm._bounded_search(problem, root, bound)
+
+
+class IDAStarSearchParallel(IDAStarSearch):
+    """
+    Parallel-window IDA*: each worker process runs a full bounded pass from the
+    root with its own threshold (bound, bound + step, bound + 2 * step, ...).
+
+    Results are consumed in threshold order, and the first success whose lower
+    thresholds all failed is returned, so with integer step costs and
+    bound_step <= 1 the solution is optimal. For the sliding puzzle every f
+    value along an iteration has the same parity, so bound_step=2 skips
+    thresholds that cannot change the search.
+
+    Workers inherit the heuristic closure via fork; on platforms without the
+    fork start method this falls back to serial IDA*.
+    """
+
+    def __init__(
+        self,
+        heuristic: Heuristic,
+        workers: int | None = None,
+        bound_step: float = 1.0,
+    ) -> None:
+        super().__init__(heuristic)
+        self.workers = workers or os.cpu_count() or 1
+        self.bound_step = bound_step
+
+    def search(self, problem: Problem) -> SearchResult:
+        global _parallel_ida_job
+        if self.workers < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            return super().search(problem)
+
+        start_time = time.perf_counter()
+        root: _Frame = (problem.initial_state(), None, None, 0.0, 0)
+        bound = self.heuristic(root[0])
+        nodes_expanded = 0
+
+        _parallel_ida_job = (self, problem, root)
+        pool = multiprocessing.get_context("fork").Pool(self.workers)
+        try:
+            while True:
+                bounds = [bound + i * self.bound_step for i in range(self.workers)]
+                pending = [pool.apply_async(_parallel_ida_worker, (b,)) for b in bounds]
+
+                t = float('inf')
+                for window in pending:
+                    t, solution, expanded = window.get()
+                    nodes_expanded += expanded
+                    self._report(nodes_expanded)
+                    if t == -1.0:
+                        end_time = time.perf_counter()
+                        return SearchResult(
+                            solution_node=self._frame_to_node(solution),
+                            success=True,
+                            nodes_expanded=nodes_expanded,
+                            runtime=end_time - start_time
+                        )
+
+                if t == float('inf'):
+                    end_time = time.perf_counter()
+                    return SearchResult(
+                        solution_node=None,
+                        success=False,
+                        nodes_expanded=nodes_expanded,
+                        runtime=end_time - start_time
+                    )
+
+                # t is the next threshold reported by the widest window.
+                bound = t
+        finally:
+            # Stops windows above the winning threshold that are still running.
+            pool.terminate()
+            _parallel_ida_job = None
+
+
 class GeneticAlgorithmSearch(SearchAlgorithm):
     def __init__(
         self,
@@ -356,34 +604,74 @@ class GeneticAlgorithmSearch(SearchAlgorithm):
         population_size: int = 50,
         mutation_rate: float = 0.1,
         max_generations: int = 100,
-        chromosome_length: int = 30
+        chromosome_length: int = 30,
+        elite_size: int = 1,
+        parallel_runs: int = 1,
+        seeds: Sequence[int] | None = None,
     ) -> None:
+        """
+        With parallel_runs > 1, independent populations (islands without
+        migration) evolve in forked processes and the cheapest solution wins.
+        """
         self.heuristic = heuristic
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.max_generations = max_generations
         self.chromosome_length = chromosome_length
+        self.elite_size = elite_size
+        self.parallel_runs = parallel_runs
+        self.seeds = seeds
 
     def search(self, problem: Problem) -> SearchResult:
+        if self.parallel_runs > 1 and "fork" in multiprocessing.get_all_start_methods():
+            return _multi_start_search(self, problem, self.parallel_runs, self.seeds)
+        return self._single_run(problem)
+
+    def _single_run(self, problem: Problem) -> SearchResult:
         start_time = time.perf_counter()
         
         all_actions = ["UP", "DOWN", "LEFT", "RIGHT"]
 
         def random_individual() -> List[str]:
-            return [random.choice(all_actions) for _ in range(self.chromosome_length)]
-
-        def evaluate(individual: List[str]) -> tuple[float, Node]:
+            return random.choices(all_actions, k=self.chromosome_length)
+
+        # Legal moves per visited state. Every individual replays its plan from the
+        # same start, so the same states recur across the whole population.
+        transitions: dict[Any, dict[Any, Any]] = {}
+
+        def next_state_for(state: Any, action: str) -> Any:
+            """Return the state reached by action, or None if it is not legal in state."""
+            moves = transitions.get(state)
+            if moves is None:
+                moves = transitions[state] = {
+                    a: ns for a, ns, _ in problem.successors(state)
+                }
+            return moves.get(action)
+
+        def evaluate(individual: List[str]) -> float:
             """
-            Run the individual's plan. Return (fitness, final_node).
-            Fitness = 1 / (h(state) + 1).
+            Run the individual's plan on bare states. Return its fitness,
+            1 / (h(state) + 1), or +inf if the plan reaches the goal.
             """
             current_state = problem.initial_state()
-            current_node = Node(current_state)
             
             for action in individual:
-                valid_actions = list(problem.actions(current_state))
-                if action in valid_actions:
-                    next_state = problem.result(current_state, action)
+                next_state = next_state_for(current_state, action)
+                if next_state is not None:
+                    current_state = next_state
+                    if problem.is_goal(current_state):
+                        return float('inf')
+            
+            h_val = self.heuristic(current_state)
+            return 1.0 / (h_val + 1.0)
+
+        def build_path(individual: List[str]) -> Node:
+            """Replay the plan as a Node chain, stopping at the goal if it is reached."""
+            current_node = Node(problem.initial_state())
+            
+            for action in individual:
+                next_state = next_state_for(current_node.state, action)
+                if next_state is not None:
                     current_node = Node(
                         state=next_state,
                         parent=current_node,
@@ -391,41 +679,39 @@ class GeneticAlgorithmSearch(SearchAlgorithm):
                         path_cost=current_node.path_cost + 1,
                         depth=current_node.depth + 1
                     )
-                    current_state = next_state
-                    if problem.is_goal(current_state):
-                        return float('inf'), current_node
-                else:
-                    pass
+                    if problem.is_goal(next_state):
+                        break
             
-            h_val = self.heuristic(current_state)
-            return 1.0 / (h_val + 1.0), current_node
+            return current_node
 
         population = [random_individual() for _ in range(self.population_size)]
         
         nodes_expanded = 0
         best_solution: Node | None = None
-        scored_population = []
+        elite: List[Tuple[float, List[str]]] = []
         
         for generation in range(self.max_generations):
             scored_population = []
             for ind in population:
-                fitness, final_node = evaluate(ind)
+                fitness = evaluate(ind)
                 nodes_expanded += self.chromosome_length
                 scored_population.append((fitness, ind))
                 
                 if fitness == float('inf'):
                     end_time = time.perf_counter()
                     return SearchResult(
-                        solution_node=final_node,
+                        solution_node=build_path(ind),
                         success=True,
                         nodes_expanded=nodes_expanded,
                         runtime=end_time - start_time,
                         iterations=generation
                     )
+            self._report(nodes_expanded)
             
-            scored_population.sort(key=lambda x: x[0], reverse=True)
+            # Only the top elite_size individuals need ordering: O(n log k) vs a full sort.
+            elite = heapq.nlargest(self.elite_size, scored_population, key=lambda x: x[0])
             
-            new_population = [scored_population[0][1]]
+            new_population = [ind for _, ind in elite]
             
             while len(new_population) < self.population_size:
                 parent1 = self._select(scored_population)
@@ -436,8 +722,8 @@ class GeneticAlgorithmSearch(SearchAlgorithm):
             
             population = new_population
 
-        best_fitness, best_ind = scored_population[0]
-        _, best_node = evaluate(best_ind)
+        best_fitness, best_ind = elite[0]
+        best_node = build_path(best_ind)
         
         end_time = time.perf_counter()
         return SearchResult(
@@ -450,7 +736,8 @@ class GeneticAlgorithmSearch(SearchAlgorithm):
 
     def _select(self, scored_population: List[Tuple[float, List[str]]]) -> List[str]:
         k = 3
-        candidates = random.sample(scored_population, k)
+        # Tournament with replacement: cheaper than sample() and the usual formulation.
+        candidates = random.choices(scored_population, k=k)
         return max(candidates, key=lambda x: x[0])[1]
 
     def _crossover(self, p1: List[str], p2: List[str]) -> List[str]:
@@ -459,6 +746,6 @@ class GeneticAlgorithmSearch(SearchAlgorithm):
 
     def _mutate(self, ind: List[str], all_actions: List[str]) -> List[str]:
         if random.random() < self.mutation_rate:
-            idx = random.randint(0, len(ind) - 1)
+            idx = random.randrange(len(ind))
             ind[idx] = random.choice(all_actions)
         return ind
@@ -1,62 +1,15 @@
 from __future__ import annotations
+import argparse
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from src.domain import SlidingPuzzleProblem
-from src.algorithms import (
-    misplaced_tiles_heuristic,
-    manhattan_distance_heuristic,
-    linear_conflict_heuristic,
-    AStarSearch,
-    GreedyBestFirstSearch,
-    HillClimbingSearch,
-    SimulatedAnnealingSearch,
-    IDAStarSearch,
-    GeneticAlgorithmSearch,
-)
+from src.algorithms import build_algorithm, clear_heuristic_cache
 from src.core import SearchAgent, SearchResult
 
 
-def build_algorithm(name: str, problem: SlidingPuzzleProblem):
-    h_misplaced = misplaced_tiles_heuristic(problem.goal_state)
-    h_manhattan = manhattan_distance_heuristic(problem.goal_state, problem.size)
-    h_linear = linear_conflict_heuristic(problem.goal_state, problem.size)
-
-    if name == "astar_misplaced":
-        return AStarSearch(heuristic=h_misplaced)
-    if name == "astar_manhattan":
-        return AStarSearch(heuristic=h_manhattan)
-    if name == "astar_weighted":
-        return AStarSearch(heuristic=h_manhattan, weight=1.5)
-    if name == "astar_linear":
-        return AStarSearch(heuristic=h_linear)
-    if name == "greedy_manhattan":
-        return GreedyBestFirstSearch(heuristic=h_manhattan)
-    if name == "hill_climbing_manhattan":
-        return HillClimbingSearch(heuristic=h_manhattan, max_steps=2000)
-    if name == "sa_manhattan":
-        return SimulatedAnnealingSearch(
-            heuristic=h_manhattan,
-            T0=10.0,
-            alpha=0.99,
-            max_steps=5000,
-        )
-    if name == "idastar_manhattan":
-        return IDAStarSearch(heuristic=h_manhattan)
-    if name == "idastar_linear":
-        return IDAStarSearch(heuristic=h_linear)
-    if name == "genetic_manhattan":
-        return GeneticAlgorithmSearch(
-            heuristic=h_manhattan,
-            population_size=50,
-            mutation_rate=0.1,
-            max_generations=100,
-            chromosome_length=30
-        )
-
-    raise ValueError(f"Unknown algorithm: {name}")
-
-
 def run_single_experiment(
     size: int,
     scramble_depth: int,
@@ -67,19 +20,50 @@ def run_single_experiment(
     algo = build_algorithm(algo_name, problem)
     agent = SearchAgent(problem, algo)
     result = agent.solve()
+    # Heuristic memo tables can hold up to H_CACHE_SIZE states; release them per run.
+    clear_heuristic_cache(algo.heuristic)
     return result
 
 
+def _run_experiment_row(task: Tuple[str, int, int, int]) -> list:
+    """Worker entry point: run one (algorithm, size, depth, seed) experiment and return its CSV row."""
+    algo, size, scramble_depth, seed = task
+    result = run_single_experiment(size, scramble_depth, seed, algo)
+    return [
+        algo,
+        size,
+        scramble_depth,
+        seed,
+        int(result.success),
+        result.solution_cost,
+        result.nodes_expanded,
+        result.runtime,
+        result.iterations,
+    ]
+
+
 def run_batch_and_write_csv(
     algo_names: List[str],
     size: int,
     scramble_depth: int,
     runs: int,
     output_path: Path,
+    workers: Optional[int] = 1,
 ) -> None:
+    """
+    Run every algorithm on `runs` seeded puzzles and write one CSV row per run.
+
+    Runs are independent, so they can be spread over `workers` processes
+    (None: os.cpu_count()). The default of 1 runs them in-process, one at a
+    time: parallel runs contend for cores and memory bandwidth, which
+    inflates the runtime column. Each row records the worker count.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    tasks = [(algo, size, scramble_depth, seed) for algo in algo_names for seed in range(runs)]
+    workers = workers or os.cpu_count() or 1
 
-    with output_path.open("w", newline="") as f:
+    # Large write buffer: rows are small and arrive in bursts from the pool.
+    with output_path.open("w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -92,28 +76,30 @@ def run_batch_and_write_csv(
                 "nodes_expanded",
                 "runtime",
                 "iterations",
+                "workers",
             ]
         )
 
-        for algo in algo_names:
-            for seed in range(runs):
-                result = run_single_experiment(size, scramble_depth, seed, algo)
-                writer.writerow(
-                    [
-                        algo,
-                        size,
-                        scramble_depth,
-                        seed,
-                        int(result.success),
-                        result.solution_cost,
-                        result.nodes_expanded,
-                        result.runtime,
-                        result.iterations,
-                    ]
-                )
+        if workers == 1:
+            writer.writerows(row + [workers] for row in map(_run_experiment_row, tasks))
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = executor.map(_run_experiment_row, tasks, chunksize=8)
+            writer.writerows(row + [workers] for row in rows)
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the puzzle benchmark suite")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Experiment runs in parallel (0: one per core). Parallel runs "
+        "finish sooner but report inflated runtimes.",
+    )
+    workers = parser.parse_args().workers or None
+
     algo_names = [
         "astar_misplaced",
         "astar_manhattan",
@@ -129,7 +115,7 @@ def main() -> None:
 
     print("Running 3x3 Experiments...")
     output_3x3 = Path("results") / "puzzle_experiments_size3_depth20.csv"
-    run_batch_and_write_csv(algo_names, 3, 20, runs, output_3x3)
+    run_batch_and_write_csv(algo_names, 3, 20, runs, output_3x3, workers)
     print(f"Finished 3x3. Results written to {output_3x3}")
 
     print("Running 4x4 Experiments...")
@@ -142,7 +128,7 @@ def main() -> None:
         "hill_climbing_manhattan",
     ]
     output_4x4 = Path("results") / "puzzle_experiments_size4_depth40.csv"
-    run_batch_and_write_csv(algo_names_4x4, 4, 40, runs, output_4x4)
+    run_batch_and_write_csv(algo_names_4x4, 4, 40, runs, output_4x4, workers)
     print(f"Finished 4x4. Results written to {output_4x4}")
 
 
@@ -1,6 +1,16 @@
 from .problem import Problem
 from .node import Node
-from .results import SearchResult
+from .results import SearchResult, SearchCancelled
+from .pqueue import PriorityQueue, HeapQueue, BucketQueue
 from .agent import SearchAgent
 
-__all__ = ["Problem", "Node", "SearchResult", "SearchAgent"]
+__all__ = [
+    "Problem",
+    "Node",
+    "SearchResult",
+    "SearchCancelled",
+    "PriorityQueue",
+    "HeapQueue",
+    "BucketQueue",
+    "SearchAgent",
+]
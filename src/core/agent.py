@@ -1,6 +1,9 @@
 from __future__ import annotations
+import threading
+import time
+from typing import Callable, Optional
 from .problem import Problem
-from .results import SearchResult
+from .results import SearchResult, SearchCancelled
 from src.algorithms import SearchAlgorithm
 
 
@@ -9,5 +12,25 @@ class SearchAgent:
         self.problem = problem
         self.algorithm = algorithm
 
-    def solve(self) -> SearchResult:
-        return self.algorithm.search(self.problem)
+    def solve(
+        self,
+        cancel_event: Optional[threading.Event] = None,
+        progress_cb: Optional[Callable[[int], None]] = None,
+    ) -> SearchResult:
+        """
+        Run the search. progress_cb(nodes_expanded) is called periodically from
+        the searching thread; setting cancel_event stops the search, which then
+        returns an unsuccessful result.
+        """
+        self.algorithm.cancel_event = cancel_event
+        self.algorithm.progress_cb = progress_cb
+        start_time = time.perf_counter()
+        try:
+            return self.algorithm.search(self.problem)
+        except SearchCancelled as exc:
+            return SearchResult(
+                solution_node=None,
+                success=False,
+                nodes_expanded=exc.nodes_expanded,
+                runtime=time.perf_counter() - start_time,
+            )
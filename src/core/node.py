@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
 from .problem import Problem
@@ -13,22 +13,20 @@ class Node:
     action: Any = None
     path_cost: float = 0.0
     depth: int = 0
+    # Heuristic value of `state`, filled in lazily by the search algorithms.
+    h_value: Optional[float] = field(default=None, compare=False)
 
     def expand(self, problem: Problem) -> List["Node"]:
-        children: List[Node] = []
-        for action in problem.actions(self.state):
-            next_state = problem.result(self.state, action)
-            cost = self.path_cost + problem.step_cost(self.state, action, next_state)
-            children.append(
-                Node(
-                    state=next_state,
-                    parent=self,
-                    action=action,
-                    path_cost=cost,
-                    depth=self.depth + 1,
-                )
+        return [
+            Node(
+                state=next_state,
+                parent=self,
+                action=action,
+                path_cost=self.path_cost + cost,
+                depth=self.depth + 1,
             )
-        return children
+            for action, next_state, cost in problem.successors(self.state)
+        ]
 
     def solution_path(self) -> List["Node"]:
         node: Optional[Node] = self
@@ -36,4 +34,5 @@ class Node:
         while node is not None:
             path.append(node)
             node = node.parent
-        return list(reversed(path))
+        path.reverse()
+        return path
@@ -0,0 +1,81 @@
+from __future__ import annotations
+import heapq
+from typing import Any, List, Protocol, Tuple
+
+
+class PriorityQueue(Protocol):
+    """Min-priority queue used for search frontiers."""
+
+    def push(self, priority: float, item: Any) -> None:
+        ...
+
+    def pop(self) -> Any:
+        """Remove and return an item with the smallest priority."""
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class HeapQueue:
+    """Binary heap (heapq); equal priorities are served first-in, first-out."""
+
+    __slots__ = ("_heap", "_counter")
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = 0
+
+    def push(self, priority: float, item: Any) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (priority, self._counter, item))
+
+    def pop(self) -> Any:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketQueue:
+    """
+    Bucket queue for non-negative integer priorities: one list per priority
+    value, O(1) push and amortised O(1) pop while priorities stay close
+    together (as A* f-values do). Equal priorities are served last-in,
+    first-out, which favours deeper nodes on f ties.
+
+    max_priority only sizes the initial bucket array; it grows as needed.
+    """
+
+    __slots__ = ("_buckets", "_min", "_size")
+
+    def __init__(self, max_priority: int = 64) -> None:
+        self._buckets: List[List[Any]] = [[] for _ in range(max_priority + 1)]
+        self._min = max_priority + 1
+        self._size = 0
+
+    def push(self, priority: float, item: Any) -> None:
+        f = int(priority)
+        if f != priority or f < 0:
+            raise ValueError(f"BucketQueue needs non-negative integer priorities, got {priority}")
+        buckets = self._buckets
+        if f >= len(buckets):
+            buckets.extend([] for _ in range(f + 1 - len(buckets)))
+        buckets[f].append(item)
+        if f < self._min:
+            self._min = f
+        self._size += 1
+
+    def pop(self) -> Any:
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+        buckets = self._buckets
+        f = self._min
+        while not buckets[f]:
+            f += 1
+        self._min = f
+        self._size -= 1
+        return buckets[f].pop()
+
+    def __len__(self) -> int:
+        return self._size
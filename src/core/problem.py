@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Hashable
+from typing import Any, Iterable, Hashable, Tuple
 
 
 class Problem(ABC):
@@ -20,6 +20,12 @@ class Problem(ABC):
     def step_cost(self, state: Any, action: Any, next_state: Any) -> float:
         return 1.0
 
+    def successors(self, state: Any) -> Iterable[Tuple[Any, Any, float]]:
+        """Yield (action, next_state, step_cost) for every action applicable in state."""
+        for action in self.actions(state):
+            next_state = self.result(state, action)
+            yield action, next_state, self.step_cost(state, action, next_state)
+
     @abstractmethod
     def is_goal(self, state: Any) -> bool:
         raise NotImplementedError
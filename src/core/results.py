@@ -1,9 +1,9 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 from .node import Node
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """
     Container for search outcomes.
@@ -21,13 +21,17 @@ class SearchResult:
     nodes_expanded: int
     runtime: float
     iterations: int = 0
+    # solution_path, built on first access (slots rule out cached_property).
+    _path: Optional[List[Node]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def solution_path(self) -> List[Node]:
         """Return the sequence of nodes from root to goal, or [] if no solution."""
         if self.solution_node is None:
             return []
-        return self.solution_node.solution_path()
+        if self._path is None:
+            self._path = self.solution_node.solution_path()
+        return self._path
 
     @property
     def solution_cost(self) -> float:
@@ -35,3 +39,11 @@ class SearchResult:
         if self.solution_node is None:
             return float("inf")
         return self.solution_node.path_cost
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search when its cancel_event is set; SearchAgent turns it into a failed result."""
+
+    def __init__(self, nodes_expanded: int) -> None:
+        super().__init__(f"Search cancelled after {nodes_expanded} expansions")
+        self.nodes_expanded = nodes_expanded
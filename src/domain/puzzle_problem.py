@@ -1,8 +1,38 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Iterable, List, Tuple
 import random
 from src.core import Problem
 
+
+@lru_cache(maxsize=8)
+def _move_tables(size: int) -> tuple:
+    """
+    Move tables depend only on the board size, so instances of the same size
+    share one read-only copy: (neighbors, swap_index, row_fmt). Bounded so a
+    long-running process does not keep tables for every size it ever saw.
+    """
+    # Per blank index: the legal (action, index swapped with the blank) pairs.
+    neighbors = tuple(_blank_moves(size, idx) for idx in range(size * size))
+    swap_index = tuple(dict(moves) for moves in neighbors)
+    row_fmt = " ".join(["{:>2}"] * size)
+    return neighbors, swap_index, row_fmt
+
+
+def _blank_moves(size: int, idx_blank: int) -> Tuple[Tuple[str, int], ...]:
+    row, col = divmod(idx_blank, size)
+    moves: List[Tuple[str, int]] = []
+    if row > 0:
+        moves.append(("UP", (row - 1) * size + col))
+    if row < size - 1:
+        moves.append(("DOWN", (row + 1) * size + col))
+    if col > 0:
+        moves.append(("LEFT", row * size + col - 1))
+    if col < size - 1:
+        moves.append(("RIGHT", row * size + col + 1))
+    return tuple(moves)
+
+
 class SlidingPuzzleProblem(Problem):
     def __init__(
         self,
@@ -18,6 +48,12 @@ class SlidingPuzzleProblem(Problem):
         self._initial_state: Tuple[int, ...] = (
             initial_state if initial_state is not None else self._goal_state
         )
+        # Bits per tile in the packed form: 4 for 8- and 15-puzzles.
+        self._tile_bits = max(1, (size * size - 1).bit_length())
+        tables = _move_tables(size)
+        self._neighbors: Tuple[Tuple[Tuple[str, int], ...], ...]
+        self._swap_index: Tuple[dict[str, int], ...]
+        self._neighbors, self._swap_index, self._row_fmt = tables
 
     def _default_goal_state(self) -> Tuple[int, ...]:
         n = self.size * self.size
@@ -37,51 +73,75 @@ class SlidingPuzzleProblem(Problem):
         return row * self.size + col
 
     def actions(self, state: Tuple[int, ...]) -> Iterable[str]:
-        idx_blank = state.index(0)
-        row, col = self._index_to_pos(idx_blank)
-
-        if row > 0:
-            yield "UP"
-        if row < self.size - 1:
-            yield "DOWN"
-        if col > 0:
-            yield "LEFT"
-        if col < self.size - 1:
-            yield "RIGHT"
+        return [action for action, _ in self._neighbors[state.index(0)]]
 
     def result(self, state: Tuple[int, ...], action: str) -> Tuple[int, ...]:
         idx_blank = state.index(0)
-        row, col = self._index_to_pos(idx_blank)
-
-        if action == "UP":
-            new_row, new_col = row - 1, col
-        elif action == "DOWN":
-            new_row, new_col = row + 1, col
-        elif action == "LEFT":
-            new_row, new_col = row, col - 1
-        elif action == "RIGHT":
-            new_row, new_col = row, col + 1
-        else:
-            raise ValueError(f"Unknown action: {action}")
-
-        idx_swap = self._pos_to_index(new_row, new_col)
+        idx_swap = self._swap_index[idx_blank].get(action)
+        if idx_swap is None:
+            raise ValueError(f"Unknown or illegal action: {action}")
 
         state_list = list(state)
-        state_list[idx_blank], state_list[idx_swap] = state_list[idx_swap], state_list[idx_blank]
+        state_list[idx_blank], state_list[idx_swap] = state_list[idx_swap], 0
         return tuple(state_list)
 
+    def successors(self, state: Tuple[int, ...]) -> List[Tuple[str, Tuple[int, ...], float]]:
+        # Locate the blank once and swap directly instead of going through
+        # actions()/result()/step_cost() per move.
+        idx_blank = state.index(0)
+        children: List[Tuple[str, Tuple[int, ...], float]] = []
+        for action, idx_swap in self._neighbors[idx_blank]:
+            state_list = list(state)
+            state_list[idx_blank], state_list[idx_swap] = state_list[idx_swap], 0
+            children.append((action, tuple(state_list), 1.0))
+        return children
+
+    def pack(self, state: Tuple[int, ...]) -> int:
+        """
+        Pack a state into a single int, `_tile_bits` bits per tile with the first
+        tile in the most significant position (36 bits for 3x3, 64 for 4x4).
+        """
+        bits = self._tile_bits
+        packed = 0
+        for tile in state:
+            packed = (packed << bits) | tile
+        return packed
+
+    def unpack(self, packed: int) -> Tuple[int, ...]:
+        """Inverse of pack()."""
+        bits = self._tile_bits
+        mask = (1 << bits) - 1
+        n = self.size * self.size
+        return tuple((packed >> (bits * (n - 1 - i))) & mask for i in range(n))
+
     def is_goal(self, state: Tuple[int, ...]) -> bool:
         return state == self._goal_state
 
+    def is_solvable(self, state: Tuple[int, ...] | None = None) -> bool:
+        """
+        Whether the goal is reachable from state (default: the initial state).
+        Only half of all boards are: moves preserve the parity of the tile
+        inversions, plus the blank's row on even-width boards.
+        """
+        if state is None:
+            state = self._initial_state
+        return self._parity(state) == self._parity(self._goal_state)
+
+    def _parity(self, state: Tuple[int, ...]) -> int:
+        tiles = [tile for tile in state if tile != 0]
+        inversions = sum(
+            1 for i, tile in enumerate(tiles) for other in tiles[i + 1:] if other < tile
+        )
+        if self.size % 2 == 0:
+            inversions += state.index(0) // self.size
+        return inversions % 2
+
     def display_state(self, state: Tuple[int, ...]) -> str:
-        rows: List[str] = []
-        for r in range(self.size):
-            row_vals = []
-            for c in range(self.size):
-                val = state[self._pos_to_index(r, c)]
-                row_vals.append(" ." if val == 0 else f"{val:2d}")
-            rows.append(" ".join(row_vals))
-        return "\n".join(rows)
+        size = self.size
+        cells = [" ." if val == 0 else val for val in state]
+        return "\n".join(
+            self._row_fmt.format(*cells[r * size:(r + 1) * size]) for r in range(size)
+        )
 
     @classmethod
     def scrambled(
@@ -92,9 +152,13 @@ class SlidingPuzzleProblem(Problem):
     ) -> "SlidingPuzzleProblem":
         rng = random.Random(seed)
         base = cls(size=size)
-        state = base.goal_state
+        # Walk the blank through the neighbor table on a mutable board; the
+        # same seed picks the same moves as stepping through actions()/result().
+        neighbors = base._neighbors
+        state = list(base.goal_state)
+        idx_blank = state.index(0)
         for _ in range(scramble_depth):
-            acts = list(base.actions(state))
-            a = rng.choice(acts)
-            state = base.result(state, a)
-        return cls(size=size, initial_state=state, goal_state=base.goal_state)
+            _, idx_swap = rng.choice(neighbors[idx_blank])
+            state[idx_blank], state[idx_swap] = state[idx_swap], 0
+            idx_blank = idx_swap
+        return cls(size=size, initial_state=tuple(state), goal_state=base.goal_state)
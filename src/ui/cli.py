@@ -2,17 +2,7 @@ from __future__ import annotations
 import argparse
 import sys
 from src.domain import SlidingPuzzleProblem
-from src.algorithms import (
-    misplaced_tiles_heuristic,
-    manhattan_distance_heuristic,
-    linear_conflict_heuristic,
-    AStarSearch,
-    GreedyBestFirstSearch,
-    HillClimbingSearch,
-    SimulatedAnnealingSearch,
-    IDAStarSearch,
-    GeneticAlgorithmSearch,
-)
+from src.algorithms import ALGORITHM_FACTORIES, SimulatedAnnealingSearch, build_algorithm
 from src.core import SearchAgent
 
 
@@ -92,50 +82,16 @@ def get_interactive_input():
     return size, depth, algo_name, seed
 
 
-def run_search(size, scramble_depth, algo_name, seed):
+def run_search(size, scramble_depth, algo_name, seed, sa_workers=1):
     problem = SlidingPuzzleProblem.scrambled(size=size, scramble_depth=scramble_depth, seed=seed)
 
     print("\nInitial state:")
     print(problem.display_state(problem.initial_state()))
     print()
 
-    h_misplaced = misplaced_tiles_heuristic(problem.goal_state)
-    h_manhattan = manhattan_distance_heuristic(problem.goal_state, problem.size)
-    h_linear = linear_conflict_heuristic(problem.goal_state, problem.size)
-
-    if algo_name == "astar_misplaced":
-        algo = AStarSearch(heuristic=h_misplaced)
-    elif algo_name == "astar_manhattan":
-        algo = AStarSearch(heuristic=h_manhattan)
-    elif algo_name == "astar_weighted":
-        algo = AStarSearch(heuristic=h_manhattan, weight=1.5)
-    elif algo_name == "astar_linear":
-        algo = AStarSearch(heuristic=h_linear)
-    elif algo_name == "greedy_manhattan":
-        algo = GreedyBestFirstSearch(heuristic=h_manhattan)
-    elif algo_name == "hill_climbing_manhattan":
-        algo = HillClimbingSearch(heuristic=h_manhattan, max_steps=2000)
-    elif algo_name == "sa_manhattan":
-        algo = SimulatedAnnealingSearch(
-            heuristic=h_manhattan,
-            T0=10.0,
-            alpha=0.99,
-            max_steps=5000,
-        )
-    elif algo_name == "idastar_manhattan":
-        algo = IDAStarSearch(heuristic=h_manhattan)
-    elif algo_name == "idastar_linear":
-        algo = IDAStarSearch(heuristic=h_linear)
-    elif algo_name == "genetic_manhattan":
-        algo = GeneticAlgorithmSearch(
-            heuristic=h_manhattan,
-            population_size=50,
-            mutation_rate=0.1,
-            max_generations=100,
-            chromosome_length=30
-        )
-    else:
-        raise ValueError(f"Unknown algorithm: {algo_name}")
+    algo = build_algorithm(algo_name, problem)
+    if isinstance(algo, SimulatedAnnealingSearch):
+        algo.parallel_runs = sa_workers
 
     print(f"Running {algo_name} on {size}x{size} puzzle (depth {scramble_depth})...")
     agent = SearchAgent(problem, algo)
@@ -179,24 +135,19 @@ def main() -> None:
             "--algorithm",
             type=str,
             default="astar_manhattan",
-            choices=[
-                "astar_misplaced",
-                "astar_manhattan",
-                "astar_linear",
-                "astar_weighted",
-                "idastar_manhattan",
-                "idastar_linear",
-                "greedy_manhattan",
-                "hill_climbing_manhattan",
-                "sa_manhattan",
-                "genetic_manhattan",
-            ],
+            choices=list(ALGORITHM_FACTORIES),
             help="Algorithm to run",
         )
         parser.add_argument("--seed", type=int, default=None, help="Random seed")
+        parser.add_argument(
+            "--sa-workers",
+            type=int,
+            default=1,
+            help="Independent simulated annealing runs in parallel (best one is kept)",
+        )
         args = parser.parse_args()
         
-        run_search(args.size, args.scramble_depth, args.algorithm, args.seed)
+        run_search(args.size, args.scramble_depth, args.algorithm, args.seed, args.sa_workers)
     else:
         size, depth, algo, seed = get_interactive_input()
         run_search(size, depth, algo, seed)
@@ -4,17 +4,7 @@ import time
 import threading
 from typing import Optional, List
 from src.domain import SlidingPuzzleProblem
-from src.algorithms import (
-    misplaced_tiles_heuristic,
-    manhattan_distance_heuristic,
-    linear_conflict_heuristic,
-    AStarSearch,
-    GreedyBestFirstSearch,
-    HillClimbingSearch,
-    SimulatedAnnealingSearch,
-    IDAStarSearch,
-    GeneticAlgorithmSearch,
-)
+from src.algorithms import ALGORITHM_FACTORIES
 from src.core import SearchAgent, Node
 
 class PuzzleGUI:
@@ -37,12 +27,23 @@ class PuzzleGUI:
         self.tile_size = 100
         self.padding = 5
         self.animation_speed = 0.2
+        # Sliding a tile between cells: slide_frames moves, slide_frame_ms apart.
+        self.slide_frames = 12
+        self.slide_frame_ms = 16
         
         self.problem: Optional[SlidingPuzzleProblem] = None
         self.current_state = None
         self.solution_path: List[Node] = []
         self.current_step = 0
         self.is_animating = False
+        # Canvas items per tile value: (rectangle id, text id), plus the state they show.
+        self._tile_items: dict[int, tuple[int, int]] = {}
+        self._drawn_state = None
+        # Pending after() id of an in-flight tile slide and the state it ends on.
+        self._slide_job = None
+        self._slide_target = None
+        # Set to stop the running AI search; None when no search is running.
+        self._cancel: Optional[threading.Event] = None
         
         self._configure_styles()
         self._setup_ui()
@@ -109,7 +110,10 @@ class PuzzleGUI:
         ttk.Entry(control_panel, textvariable=self.depth_var).pack(fill=tk.X, pady=(5, 15))
         
         ttk.Button(control_panel, text="New Game (Scramble)", command=self._scramble).pack(fill=tk.X, pady=5)
-        ttk.Button(control_panel, text="AI Solve", command=self._solve).pack(fill=tk.X, pady=5)
+        self.btn_solve = ttk.Button(control_panel, text="AI Solve", command=self._solve)
+        self.btn_solve.pack(fill=tk.X, pady=5)
+        self.btn_cancel = ttk.Button(control_panel, text="Cancel", command=self._cancel_solve, state=tk.DISABLED)
+        self.btn_cancel.pack(fill=tk.X, pady=5)
         
         ttk.Separator(control_panel, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=20)
         
@@ -147,6 +151,9 @@ Tips:
         messagebox.showinfo("Instructions", msg)
 
     def _update_canvas_size(self):
+        if self._slide_job is not None:
+            self.root.after_cancel(self._slide_job)
+            self._slide_job = None
         if hasattr(self, 'canvas'):
             self.canvas.destroy()
             
@@ -154,6 +161,8 @@ Tips:
         self.canvas = tk.Canvas(self.canvas_container, width=canvas_px, height=canvas_px, bg=self.colors["canvas_bg"], highlightthickness=0)
         self.canvas.pack(pady=20)
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        self._tile_items = {}
+        self._drawn_state = None
 
     def _init_puzzle(self):
         self.problem = SlidingPuzzleProblem(size=self.size) 
@@ -229,36 +238,96 @@ Tips:
         self.lbl_status.config(text=f"Scrambled (Depth {depth})", foreground="#334155")
         self.canvas.config(bg=self.colors["canvas_bg"])
 
+    def _tile_box(self, idx):
+        gap = 4
+        row, col = divmod(idx, self.size)
+        x = col * self.tile_size + self.padding + gap // 2
+        y = row * self.tile_size + self.padding + gap // 2
+        return x, y, self.tile_size - gap
+
+    def _tile_color(self, idx, tile_val):
+        is_correct = idx == tile_val - 1
+        return self.colors["tile_correct"] if is_correct else self.colors["tile"]
+
     def _draw_state(self, state):
+        """Show state, moving only the tiles whose cell changed since the last draw."""
+        self._finish_slide()
+        if self._drawn_state is None or len(self._drawn_state) != len(state):
+            self._draw_full(state)
+            return
+
+        for i, (old_val, tile_val) in enumerate(zip(self._drawn_state, state)):
+            if old_val == tile_val or tile_val == 0:
+                continue
+            rect_id, text_id = self._tile_items[tile_val]
+            x, y, size = self._tile_box(i)
+            self.canvas.coords(rect_id, x, y, x + size, y + size)
+            self.canvas.coords(text_id, x + size/2, y + size/2)
+            self.canvas.itemconfig(rect_id, fill=self._tile_color(i, tile_val))
+        self._drawn_state = tuple(state)
+
+    def _slide_to(self, state):
+        """Glide the one tile that differs from the drawn state into place, then snap to state."""
+        self._finish_slide()
+        old = self._drawn_state
+        changed = []
+        if old is not None and len(old) == len(state):
+            changed = [i for i, (a, b) in enumerate(zip(old, state)) if a != b]
+        if len(changed) != 2:
+            self._draw_state(state)
+            return
+
+        i, j = changed
+        dst, src = (i, j) if state[i] != 0 else (j, i)
+        rect_id, text_id = self._tile_items[state[dst]]
+        x0, y0, _ = self._tile_box(src)
+        x1, y1, _ = self._tile_box(dst)
+        frames = self.slide_frames
+        dx, dy = (x1 - x0) / frames, (y1 - y0) / frames
+        self._slide_target = state
+
+        def frame(k):
+            self.canvas.move(rect_id, dx, dy)
+            self.canvas.move(text_id, dx, dy)
+            if k < frames:
+                self._slide_job = self.root.after(self.slide_frame_ms, frame, k + 1)
+            else:
+                # Snap to exact cell coordinates and update the tile colour.
+                self._slide_job = None
+                self._draw_state(state)
+
+        frame(1)
+
+    def _finish_slide(self):
+        """Stop an in-flight slide and show its final state immediately."""
+        if self._slide_job is not None:
+            self.root.after_cancel(self._slide_job)
+            self._slide_job = None
+            self._draw_state(self._slide_target)
+
+    def _draw_full(self, state):
         self.canvas.delete("all")
+        self._tile_items = {}
+        font_size = 28 if self.size <= 3 else 20
         for i, tile_val in enumerate(state):
             if tile_val == 0:
                 continue
             
-            row, col = divmod(i, self.size)
-            
-            gap = 4
-            x = col * self.tile_size + self.padding + gap // 2
-            y = row * self.tile_size + self.padding + gap // 2
-            size = self.tile_size - gap
-            
-            goal_row, goal_col = divmod(tile_val - 1, self.size)
-            
-            is_correct = (row == goal_row and col == goal_col)
-            fill_color = self.colors["tile_correct"] if is_correct else self.colors["tile"]
+            x, y, size = self._tile_box(i)
             
-            self.canvas.create_rectangle(
+            rect_id = self.canvas.create_rectangle(
                 x, y, x + size, y + size,
-                fill=fill_color, outline="", width=0
+                fill=self._tile_color(i, tile_val), outline="", width=0
             )
             
-            font_size = 28 if self.size <= 3 else 20
-            self.canvas.create_text(
+            text_id = self.canvas.create_text(
                 x + size/2, y + size/2,
                 text=str(tile_val), 
                 font=("Segoe UI", font_size, "bold"), 
                 fill=self.colors["text"]
             )
+            self._tile_items[tile_val] = (rect_id, text_id)
+        self._drawn_state = tuple(state)
 
     def _solve(self):
         if not self.problem or self.current_state is None:
@@ -269,45 +338,46 @@ Tips:
             
         algo_name = self.algo_var.get()
         self.lbl_status.config(text="Thinking...", foreground="#eab308")
-        self.root.update()
+        self._cancel = threading.Event()
+        self.btn_solve.config(state=tk.DISABLED)
+        self.btn_cancel.config(state=tk.NORMAL)
         
-        threading.Thread(target=self._run_search, args=(solve_problem, algo_name), daemon=True).start()
+        # No root.update() here: the label and buttons repaint on the next
+        # idle pass of the event loop once this handler returns.
+        threading.Thread(target=self._run_search, args=(solve_problem, algo_name, self._cancel), daemon=True).start()
 
-    def _run_search(self, problem, algo_name):
-        h_manhattan = manhattan_distance_heuristic(problem.goal_state, problem.size)
-        h_misplaced = misplaced_tiles_heuristic(problem.goal_state)
-        h_linear = linear_conflict_heuristic(problem.goal_state, problem.size)
-        
-        if algo_name == "astar_manhattan":
-            algo = AStarSearch(h_manhattan)
-        elif algo_name == "astar_weighted":
-            algo = AStarSearch(h_manhattan, weight=1.5)
-        elif algo_name == "astar_linear":
-            algo = AStarSearch(h_linear)
-        elif algo_name == "astar_misplaced":
-            algo = AStarSearch(h_misplaced)
-        elif algo_name == "greedy_manhattan":
-            algo = GreedyBestFirstSearch(h_manhattan)
-        elif algo_name == "hill_climbing_manhattan":
-            algo = HillClimbingSearch(h_manhattan, max_steps=2000)
-        elif algo_name == "sa_manhattan":
-            algo = SimulatedAnnealingSearch(h_manhattan)
-        elif algo_name == "idastar_manhattan":
-            algo = IDAStarSearch(h_manhattan)
-        elif algo_name == "idastar_linear":
-            algo = IDAStarSearch(h_linear)
-        elif algo_name == "genetic_manhattan":
-            algo = GeneticAlgorithmSearch(h_manhattan)
-        else:
+    def _run_search(self, problem, algo_name, cancel):
+        factory = ALGORITHM_FACTORIES.get(algo_name)
+        if factory is None:
+            self.root.after(0, self._end_search)
             self.root.after(0, lambda: messagebox.showerror("Error", "Unknown algorithm"))
             return
+        algo = factory(problem)
 
         agent = SearchAgent(problem, algo)
-        result = agent.solve()
+        result = agent.solve(cancel_event=cancel, progress_cb=self._on_search_progress)
         
         self.root.after(0, lambda: self._on_solve_complete(result))
 
+    def _on_search_progress(self, nodes_expanded):
+        # Called from the search thread; hand the update to the Tk event loop.
+        self.root.after(0, lambda: self.lbl_status.config(text=f"Thinking...\nExpanded {nodes_expanded:,}"))
+
+    def _cancel_solve(self):
+        if self._cancel is not None:
+            self._cancel.set()
+            self.btn_cancel.config(state=tk.DISABLED)
+            self.lbl_status.config(text="Cancelling...", foreground="#eab308")
+
+    def _end_search(self):
+        cancelled = self._cancel is not None and self._cancel.is_set()
+        self._cancel = None
+        self.btn_solve.config(state=tk.NORMAL)
+        self.btn_cancel.config(state=tk.DISABLED)
+        return cancelled
+
     def _on_solve_complete(self, result):
+        cancelled = self._end_search()
         if result.success:
             self.solution_path = result.solution_path
             self.current_step = 0
@@ -315,6 +385,8 @@ Tips:
                 text=f"Solved!\nCost: {result.solution_cost}\nNodes: {result.nodes_expanded}\nTime: {result.runtime:.4f}s"
             )
             self._update_controls(has_solution=True)
+        elif cancelled:
+            self.lbl_status.config(text=f"Cancelled.\nNodes: {result.nodes_expanded}", foreground="#334155")
         else:
             self.lbl_status.config(text=f"Failed.\nNodes: {result.nodes_expanded}")
             messagebox.showinfo("Result", "No solution found.")
@@ -349,7 +421,7 @@ Tips:
         if self.current_step < len(self.solution_path) - 1:
             self.current_step += 1
             node = self.solution_path[self.current_step]
-            self._draw_state(node.state)
+            self._slide_to(node.state)
 
     def _reset_to_start(self):
         self.is_animating = False
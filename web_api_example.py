@@ -1,22 +1,122 @@
-from flask import Flask, request, jsonify
+import atexit
+import base64
+import functools
+import hashlib
+import logging
+import logging.handlers
+import math
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, Tuple
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 from src.domain import SlidingPuzzleProblem
 from src.algorithms import (
-    misplaced_tiles_heuristic,
-    manhattan_distance_heuristic,
-    linear_conflict_heuristic,
+    ALGORITHM_FACTORIES,
+    pattern_database_heuristic,
+    clear_heuristic_cache,
+    SearchAlgorithm,
     AStarSearch,
-    GreedyBestFirstSearch,
-    HillClimbingSearch,
-    SimulatedAnnealingSearch,
-    IDAStarSearch,
-    GeneticAlgorithmSearch,
 )
 from src.core import SearchAgent
+from src.algorithms.heuristics import PDB_MAX_STATES
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='web_demo', static_url_path='')
+# Responses are small fixed-shape dicts; sorting their keys is wasted work.
+app.json.sort_keys = False
+# Debugging (and its per-request traceback machinery) is opt-in via
+# FLASK_DEBUG=1; errors otherwise reach the server as plain 500s.
+app.config['DEBUG'] = os.getenv('FLASK_DEBUG') == '1'
+app.config['PROPAGATE_EXCEPTIONS'] = True
+# Behind a reverse proxy (see nginx.conf) set TRUSTED_PROXIES to the number of
+# proxies in front of the app, so client address and scheme come from their
+# X-Forwarded-* headers. Left off by default: the headers are spoofable.
+TRUSTED_PROXIES = int(os.environ.get("TRUSTED_PROXIES", 0))
+if TRUSTED_PROXIES > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES, x_proto=TRUSTED_PROXIES)
 CORS(app)
 
+def _read_json():
+    """Request body as JSON; decoded with orjson when it is installed."""
+    if orjson is None:
+        return request.json
+    return orjson.loads(request.get_data())
+
+def _json_response(body):
+    """
+    JSON response; encoded with orjson when it is installed (several times
+    faster on long action lists). Bodies must not contain non-finite floats:
+    orjson writes them as null but Flask's encoder as the invalid Infinity.
+    """
+    if orjson is None:
+        return jsonify(body)
+    return Response(orjson.dumps(body), mimetype="application/json")
+
+# Solves are CPU-bound, so they run in worker processes: a long search no
+# longer holds the GIL against other requests on the threaded server. Spawned
+# (not forked) because the server process is multi-threaded. SOLVER_PROCESSES=0
+# solves in the request thread instead, for servers that already run one
+# process per core (see gunicorn_conf.py).
+SOLVER_PROCESSES = int(os.environ.get("SOLVER_PROCESSES", os.cpu_count() or 1))
+# SOLVER_WARMUP=0 skips _warmup() (e.g. for quick restarts during development).
+SOLVER_WARMUP = os.environ.get("SOLVER_WARMUP", "1") != "0"
+
+def _init_worker():
+    if SOLVER_WARMUP:
+        _warmup()
+
+# Longest one search may run (seconds) before it is cancelled and answered
+# with a 504. Kept under gunicorn's 120 s worker timeout (gunicorn_conf.py).
+SOLVE_TIMEOUT = float(os.environ.get("SOLVE_TIMEOUT", 100))
+
+def _new_executor():
+    if SOLVER_PROCESSES <= 0:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=SOLVER_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+# Started on first use by _executor(): spawned pool workers import this
+# module too and must not each start a pool of their own.
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _executor():
+    """The solver pool (None when SOLVER_PROCESSES=0), started on first call."""
+    global EXECUTOR
+    if EXECUTOR is None and SOLVER_PROCESSES > 0:
+        with _executor_lock:
+            if EXECUTOR is None:
+                EXECUTOR = _new_executor()
+    return EXECUTOR
+
+class SolveError(Exception):
+    """A solve that could not complete for server-side reasons; carries the HTTP status."""
+
+    def __init__(self, message, status):
+        # Both in args, so the error survives pickling back from a pool worker.
+        super().__init__(message, status)
+        self.status = status
+
+    def __str__(self):
+        return self.args[0]
+
 @app.route('/')
 def index():
     return app.send_static_file('index.html')
@@ -27,58 +127,414 @@ def solve_puzzle():
     Endpoint for the website to call.
     Expects JSON data: { 
         "size": 3, 
-        "state": [...],
+        "state": [...] or a packed int (see SlidingPuzzleProblem.pack),
         "algorithm": "astar_manhattan" 
     }
+    With ?format=compact the moves come back as "actions_b64" and
+    "actions_len" (see _pack_actions) instead of the "actions" list.
+    """
+    compact = request.args.get('format') == 'compact'
+    try:
+        size, initial_state, algo_name = _parse_solve_request(_read_json())
+    except ValueError as exc:
+        return _json_response({"success": False, "error": str(exc)}), 400
+
+    error = _algorithm_error(size, algo_name)
+    if error is not None:
+        body, status = error
+        return _json_response(body), status
+    body = _trivial_body(size, initial_state, compact)
+    if body is not None:
+        return _json_response(body)
+
+    etag = None
+    if algo_name not in RANDOMIZED_ALGORITHMS:
+        # Deterministic solves are a pure function of the request, so a client
+        # holding the previous answer can revalidate without a body resend.
+        # Weak: the plan is fixed, but per-response fields (cached, time_taken)
+        # differ, so bodies are equivalent rather than byte-identical.
+        etag = hashlib.blake2b(
+            repr((size, initial_state, algo_name, compact)).encode(), digest_size=16
+        ).hexdigest()
+        if request.if_none_match.contains_weak(etag):
+            return Response(status=304, headers={"ETag": f'W/"{etag}"'})
+    try:
+        outcome, cached = _solve_outcome(size, initial_state, algo_name)
+    except SolveError as exc:
+        return _json_response({"success": False, "error": str(exc)}), exc.status
+
+    resp = _json_response(_outcome_body(size, initial_state, outcome, compact, cached))
+    if etag is not None:
+        resp.set_etag(etag, weak=True)
+        resp.cache_control.private = True
+        resp.cache_control.max_age = 3600
+    return resp
+
+def _parse_solve_request(data):
     """
-    data = request.json
+    Validate a /solve body and return (size, initial_state, algorithm).
+    Raises ValueError for anything that is not a legal size x size board, so
+    bad input is rejected before any search structures are built.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
     size = data.get('size', 3)
-    initial_state = tuple(data.get('state'))
+    state = data.get('state')
     algo_name = data.get('algorithm', 'astar_manhattan')
-    
+    if type(size) is not int or not 2 <= size <= MAX_SIZE:
+        raise ValueError(f"'size' must be an integer from 2 to {MAX_SIZE}")
+    if type(state) is int:
+        # Packed form: one int, tile_bits per tile, first tile most significant.
+        # JSON decoders (orjson included) only read integers up to 64 bits.
+        if _packed_bits(size) > 64:
+            raise ValueError(f"packed 'state' is not supported for {size}x{size} boards")
+        if state < 0 or state.bit_length() > _packed_bits(size):
+            raise ValueError(f"packed 'state' is out of range for a {size}x{size} board")
+        state = list(SlidingPuzzleProblem(size).unpack(state))
+    if not isinstance(state, list) or len(state) != size * size:
+        raise ValueError(f"'state' must be a packed int or a list of {size * size} tiles")
+    if not all(type(tile) is int for tile in state) or set(state) != set(range(size * size)):
+        raise ValueError(f"'state' must be a permutation of 0..{size * size - 1}")
+    if not isinstance(algo_name, str):
+        raise ValueError("'algorithm' must be a string")
+    return size, tuple(state), algo_name
+
+@app.route('/solve_batch', methods=['POST'])
+def solve_batch():
+    """
+    Solve several puzzles in one round-trip.
+    Expects JSON data: { "requests": [ <a /solve body>, ... ] }
+    Returns { "results": [...] } in request order; each entry is what /solve
+    would have answered (?format=compact applies to every entry), with
+    invalid entries carrying an "error" instead of failing the whole batch.
+    """
+    solve_item = functools.partial(
+        _solve_batch_item, compact=request.args.get('format') == 'compact'
+    )
+    try:
+        data = _read_json()
+    except ValueError:
+        data = None
+    items = data.get('requests') if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return _json_response({"success": False, "error": "Expected {\"requests\": [...]}"}), 400
+    if len(items) > MAX_BATCH_SIZE:
+        return _json_response({"success": False, "error": f"At most {MAX_BATCH_SIZE} requests per batch"}), 400
+
+    if SOLVER_PROCESSES <= 0:
+        results = _solve_batch_inline(items, solve_item)
+    elif len(items) <= 1:
+        results = [solve_item(item) for item in items]
+    else:
+        # Each thread only waits on its EXECUTOR job (or a cache hit), so the
+        # batch is solved across all worker processes at once.
+        with ThreadPoolExecutor(max_workers=min(len(items), SOLVER_PROCESSES)) as pool:
+            results = list(pool.map(solve_item, items))
+    return _json_response({"results": results})
+
+def _solve_batch_inline(items, solve_item):
+    """
+    Solve batch items one after another in this thread (SOLVER_PROCESSES=0),
+    the whole batch sharing one SOLVE_TIMEOUT budget so it ends before the
+    server's worker timeout (gunicorn's 120 s) would kill it midway. Items
+    left when the budget runs out get an error instead of a result.
+    """
+    deadline = time.monotonic() + SOLVE_TIMEOUT
+    results = []
+    try:
+        for item in items:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                results.append({"success": False, "error": "Batch time budget exhausted"})
+                continue
+            _solve_budget.timeout = remaining
+            results.append(solve_item(item))
+    finally:
+        del _solve_budget.timeout
+    return results
+
+def _solve_batch_item(data, compact=False):
+    try:
+        size, initial_state, algo_name = _parse_solve_request(data)
+    except ValueError as exc:
+        return {"success": False, "error": str(exc)}
+    error = _algorithm_error(size, algo_name)
+    if error is not None:
+        return error[0]
+    body = _trivial_body(size, initial_state, compact)
+    if body is not None:
+        return body
+    try:
+        outcome, cached = _solve_outcome(size, initial_state, algo_name)
+    except SolveError as exc:
+        return {"success": False, "error": str(exc)}
+    return _outcome_body(size, initial_state, outcome, compact, cached)
+
+def _algorithm_error(size, algo_name):
+    """(body, status) if algo_name cannot run on a size x size board, else None."""
+    if algo_name not in ALGO_FACTORIES:
+        return {"success": False, "error": "Unknown algorithm"}, 200
+    if algo_name == "astar_pdb" and not _pdb_available(size):
+        return {"success": False, "error": f"astar_pdb is not available for {size}x{size} boards"}, 400
+    return None
+
+def _trivial_body(size, initial_state, compact=False):
+    """
+    The answer for boards that need no search (already solved, or of the
+    wrong parity to ever be solved), else None. Unsolvable boards would
+    otherwise keep a worker busy exhausting the state space.
+    """
     problem = SlidingPuzzleProblem(size=size, initial_state=initial_state)
-    
-    h_manhattan = manhattan_distance_heuristic(problem.goal_state, problem.size)
-    h_misplaced = misplaced_tiles_heuristic(problem.goal_state)
-    h_linear = linear_conflict_heuristic(problem.goal_state, problem.size)
-    
-    if algo_name == "astar_manhattan":
-        algo = AStarSearch(h_manhattan)
-    elif algo_name == "astar_weighted":
-        algo = AStarSearch(h_manhattan, weight=1.5)
-    elif algo_name == "astar_linear":
-        algo = AStarSearch(h_linear)
-    elif algo_name == "astar_misplaced":
-        algo = AStarSearch(h_misplaced)
-    elif algo_name == "greedy_manhattan":
-        algo = GreedyBestFirstSearch(h_manhattan)
-    elif algo_name == "hill_climbing_manhattan":
-        algo = HillClimbingSearch(h_manhattan, max_steps=2000)
-    elif algo_name == "sa_manhattan":
-        algo = SimulatedAnnealingSearch(h_manhattan)
-    elif algo_name == "idastar_manhattan":
-        algo = IDAStarSearch(h_manhattan)
-    elif algo_name == "idastar_linear":
-        algo = IDAStarSearch(h_linear)
-    elif algo_name == "genetic_manhattan":
-        algo = GeneticAlgorithmSearch(h_manhattan)
+    if problem.is_goal(initial_state):
+        return _outcome_body(size, initial_state, (True, b"", 0, 0.0, 0.0), compact)
+    if not problem.is_solvable():
+        return {"success": False, "error": "unsolvable"}
+    return None
+
+def _outcome_body(size, initial_state, outcome, compact=False, cached=False):
+    """
+    The /solve answer for a SolveOutcome. "cached" is true when the outcome
+    was replayed from _solve_cached; its time_taken is then that of the
+    original solve, not of this request.
+    """
+    success, action_codes, nodes_expanded, time_taken, solution_cost = outcome
+    body = {"success": success}
+    if compact:
+        body["actions_b64"] = base64.b64encode(_pack_actions(action_codes)).decode("ascii")
+        body["actions_len"] = len(action_codes)
     else:
-        return jsonify({"success": False, "error": "Unknown algorithm"})
+        body["actions"] = [ACTIONS[code] for code in action_codes]
+    body.update(
+        nodes_expanded=nodes_expanded,
+        time_taken=time_taken,
+        cached=cached,
+        # Failed solves cost +inf, which JSON cannot express.
+        solution_cost=solution_cost if math.isfinite(solution_cost) else None,
+    )
+    # Only where every packed board of this size is exact as a JSON number in
+    # JavaScript (3x3 and smaller); 4x4 takes 64 bits, 5x5 more than orjson
+    # can even encode.
+    if _packed_bits(size) <= JS_SAFE_INTEGER_BITS:
+        body["packed_initial"] = SlidingPuzzleProblem(size).pack(initial_state)
+    return body
+
+def _packed_bits(size):
+    """Width of SlidingPuzzleProblem.pack() output for a size x size board."""
+    n = size * size
+    return max(1, (n - 1).bit_length()) * n
+
+def _pack_actions(action_codes):
+    """
+    Pack action codes (indices into ACTIONS) four to a byte, two bits each,
+    the first move in the lowest bits of the first byte.
+    """
+    packed = bytearray((len(action_codes) + 3) // 4)
+    for i, code in enumerate(action_codes):
+        packed[i >> 2] |= code << ((i & 3) * 2)
+    return bytes(packed)
+
+def clear_solve_cache():
+    """Drop memoized /solve results (development aid)."""
+    _solve_cached.cache_clear()
+    return _json_response({"cleared": True})
+
+# Anyone could flush the cache through this route, so it only exists in debug.
+if app.config['DEBUG']:
+    app.add_url_rule('/cache/clear', view_func=clear_solve_cache, methods=['POST'])
+
+def _pdb_available(size):
+    return math.factorial(size * size) // 2 <= PDB_MAX_STATES
+
+# Algorithm name -> factory taking the SlidingPuzzleProblem: the shared
+# registry used by the CLI and GUI, plus the names only the web API serves.
+ALGO_FACTORIES: Dict[str, Callable[[SlidingPuzzleProblem], SearchAlgorithm]] = {
+    **ALGORITHM_FACTORIES,
+    # Exact-distance table, 3x3 only; built once per worker on first use.
+    "astar_pdb": lambda p: AStarSearch(pattern_database_heuristic(p.goal_state, p.size)),
+}
+
+# Moves travel between worker, cache and view as one byte each: an index
+# into ACTIONS.
+ACTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# (success, action_codes, nodes_expanded, time_taken, solution_cost): plain
+# immutable data, cheap to send back from a worker and to keep in the cache,
+# unlike a SearchResult whose Node chain pins every state on the path.
+SolveOutcome = Tuple[bool, bytes, int, float, float]
+
+# Stochastic searches give a different answer per run, so are never cached.
+RANDOMIZED_ALGORITHMS = frozenset({"sa_manhattan", "genetic_manhattan"})
+
+# Upper bound on puzzles per /solve_batch call.
+MAX_BATCH_SIZE = 100
+
+# Largest board accepted; search effort grows explosively with size.
+MAX_SIZE = 5
+
+# Integers up to 2**53 survive a round-trip through a JavaScript number.
+JS_SAFE_INTEGER_BITS = 53
+
+def _run_solve(size, initial_state, algo_name, timeout=SOLVE_TIMEOUT) -> SolveOutcome:
+    """
+    Solve one puzzle; runs in a worker process unless SOLVER_PROCESSES=0.
+    Raises SolveError (504) if the search is still running after `timeout`
+    seconds: it is cancelled, freeing the worker and its memory.
+    """
+    # Timed from here rather than taken from result.runtime so time_taken also
+    # covers building the algorithm and its heuristic.
+    start_ns = time.perf_counter_ns()
+    problem = SlidingPuzzleProblem(size=size, initial_state=initial_state)
+    algo = ALGO_FACTORIES[algo_name](problem)
 
     agent = SearchAgent(problem, algo)
     
-    result = agent.solve()
+    cancel = threading.Event()
+    timer = threading.Timer(timeout, cancel.set)
+    timer.daemon = True
+    timer.start()
+    try:
+        result = agent.solve(cancel_event=cancel)
+    finally:
+        timer.cancel()
+        # The heuristic memoizes up to H_CACHE_SIZE states; release them now
+        # rather than whenever the algorithm is garbage collected.
+        clear_heuristic_cache(algo.heuristic)
+    if cancel.is_set() and not result.success:
+        raise SolveError(f"Search did not finish within {timeout:.3g} s", 504)
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
     
-    response = {
-        "success": result.success,
-        "actions": [node.action for node in result.solution_path if node.action],
-        "nodes_expanded": result.nodes_expanded,
-        "time_taken": result.runtime,
-        "solution_cost": result.solution_cost if hasattr(result, 'solution_cost') else len(result.solution_path)
-    }
-    
-    return jsonify(response)
+    return (
+        result.success,
+        # solution_path[0] is the start node, which has no action.
+        bytes([ACTION_CODES[node.action] for node in result.solution_path[1:]]),
+        result.nodes_expanded,
+        elapsed,
+        result.solution_cost,
+    )
+
+# In-process solves in this thread get at most _solve_budget.timeout seconds
+# when set (see _solve_batch_inline); otherwise SOLVE_TIMEOUT.
+_solve_budget = threading.local()
+
+def _solve(size, initial_state, algo_name) -> SolveOutcome:
+    executor = _executor()
+    if executor is None:
+        timeout = getattr(_solve_budget, "timeout", SOLVE_TIMEOUT)
+        return _run_solve(size, initial_state, algo_name, timeout)
+    try:
+        future = executor.submit(_run_solve, size, initial_state, algo_name)
+        # The worker cancels its own search after SOLVE_TIMEOUT; the extra
+        # allowance covers time spent queued behind other solves.
+        return future.result(timeout=2 * SOLVE_TIMEOUT)
+    except FutureTimeoutError:
+        # Still queued (or stuck): drop it if it has not started yet.
+        future.cancel()
+        raise SolveError("Solver is busy; please retry", 503)
+    except BrokenProcessPool:
+        _replace_executor(executor)
+        raise SolveError("A solver process died; please retry", 503)
+
+def _replace_executor(broken):
+    """
+    Swap in a fresh pool for one whose worker died (OOM, crash): a broken
+    ProcessPoolExecutor rejects every later submit.
+    """
+    global EXECUTOR
+    with _executor_lock:
+        if EXECUTOR is broken:
+            log.warning("Solver pool broke; starting a new one")
+            EXECUTOR = _new_executor()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+# Set by _solve_cached in the calling thread whenever lru_cache misses.
+_cache_state = threading.local()
+
+@functools.lru_cache(maxsize=8192)
+def _solve_cached(size, initial_state, algo_name) -> SolveOutcome:
+    """_solve memoized per (size, state, algorithm) for deterministic algorithms."""
+    _cache_state.missed = True
+    return _solve(size, initial_state, algo_name)
+
+def _solve_outcome(size, initial_state, algo_name) -> Tuple[SolveOutcome, bool]:
+    """Return (outcome, cached): cached is True if it came from _solve_cached's memo."""
+    if algo_name in RANDOMIZED_ALGORITHMS:
+        return _solve(size, initial_state, algo_name), False
+    _cache_state.missed = False
+    outcome = _solve_cached(size, initial_state, algo_name)
+    return outcome, not _cache_state.missed
+
+def _warmup():
+    """
+    Run a one-move solve for every algorithm on 3x3 and 4x4 boards, so this
+    process has loaded the Numba kernels and solver code paths before the
+    first real request instead of during it. Uses _run_solve directly:
+    nothing lands in the result cache.
+
+    astar_pdb is left out: its table (~30 MB) is only worth building in
+    processes that are actually asked for it.
+    """
+    for size in (3, 4):
+        problem = SlidingPuzzleProblem(size=size)
+        state = problem.result(problem.goal_state, "LEFT")
+        for algo_name in ALGO_FACTORIES:
+            if algo_name == "astar_pdb" or _algorithm_error(size, algo_name) is not None:
+                continue
+            try:
+                _run_solve(size, state, algo_name)
+            except Exception:
+                log.warning("Warm-up of %s on %dx%d failed", algo_name, size, size, exc_info=True)
+
+# In-process solving (e.g. gunicorn with preload_app) warms up once at import,
+# before workers fork; pool workers warm up in _init_worker as they start.
+if SOLVER_WARMUP and SOLVER_PROCESSES <= 0:
+    _warmup()
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _setup_logging():
+    """
+    Route all logging through a queue drained by a background thread, so
+    request threads never block on writing to stderr. Safe to call twice.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    # One access-log line per request is the bulk of the output; keep warnings.
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
 
 if __name__ == '__main__':
-    print("Starting AI Solver Server on port 5000...")
-    app.run(debug=True, port=5000)
+    _setup_logging()
+    port = int(os.getenv('PORT', 5000))
+    if SOLVER_WARMUP and SOLVER_PROCESSES > 0:
+        # Start (and so warm up) every worker now rather than on first use.
+        for _ in range(SOLVER_PROCESSES):
+            _executor().submit(int)
+    try:
+        from waitress import serve
+    except ImportError:
+        log.info("Starting AI Solver Server on port %d", port)
+        # No reloader: it would run a second copy of the server (and its
+        # solver pool) just to watch for file changes.
+        app.run(port=port, debug=app.config['DEBUG'], use_reloader=False)
+    else:
+        # Threaded server with keep-alive connections; the threads only wait
+        # on EXECUTOR, so solves still run on every core.
+        log.info("Starting AI Solver Server on port %d (waitress)", port)
+        serve(
+            app,
+            host='0.0.0.0',
+            port=port,
+            threads=(os.cpu_count() or 1) * 2,
+            connection_limit=1000,
+            channel_timeout=120,
+        )